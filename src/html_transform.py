@@ -24,12 +24,38 @@ Why selectolax/Lexbor:
 
 import logging
 import re
+from collections import Counter
 
 logger = logging.getLogger(__name__)
 
 # Lazy import for optional dependency
 _LexborHTMLParser = None
 
+# CSS selectors for the node subsets the structural pass needs
+_HEADING_SELECTOR = 'h1, h2, h3, h4, h5, h6'
+_EXTERNAL_LINK_SELECTOR = 'a[href^="http://"], a[href^="https://"]'
+_LIST_TAGS = frozenset({'ul', 'ol'})
+
+# Quill structural markers, counted in a single scan by quill_metrics()
+_COMPLIANCE_RE = re.compile(
+    r'<li\b|data-list="bullet"|<span class="ql-ui"></span>|ql-indent-(\d+)'
+)
+
+# Precompiled string-phase patterns (list conversion and post-processing)
+_BODY_OPEN_RE = re.compile(r'^<body[^>]*>')
+_BODY_CLOSE_RE = re.compile(r'</body>$')
+_LI_OPEN_RE = re.compile(r'<li([^>]*)>')
+_CLASS_ATTR_RE = re.compile(r'class="([^"]*)"')
+_QL_INDENT_RE = re.compile(r'ql-indent-(\d+)')
+_LI_WITHOUT_UI_RE = re.compile(r'(<li[^>]*>)(?!<span class="ql-ui">)')
+_HEADING_CHILD_RE = re.compile(r'\s*heading-child\s*')
+_HEADING_PARENT_RE = re.compile(r'\s*heading-parent\s*')
+_EMPTY_CLASS_RE = re.compile(r'class="\s*"')
+_SPACE_BEFORE_CLOSE_RE = re.compile(r'\s+(</(?:strong|em|b|i|u)>)')
+_SPACE_AFTER_OPEN_RE = re.compile(r'(<(?:strong|em|b|i|u)>)\s+')
+_MULTI_SPACE_RE = re.compile(r'  +')
+_ADJACENT_OL_RE = re.compile(r'</ol>\s*<ol>')
+
 
 def _get_parser():
     """Lazy import selectolax."""
@@ -75,8 +101,10 @@ def transform_for_europass(html: str, max_indent: int = 1) -> str:
     LexborHTMLParser = _get_parser()
     
     # === PHASE 1: Structural transforms with selectolax ===
+    # Only the heading and link subsets are visited (targeted CSS queries),
+    # never a full traverse() of the body.
     tree = LexborHTMLParser(html)
-    body = tree.css_first('body')
+    body = tree.body
     if not body:
         return html
     
@@ -88,8 +116,8 @@ def transform_for_europass(html: str, max_indent: int = 1) -> str:
     
     # Extract HTML from body
     result = body.html
-    result = re.sub(r'^<body[^>]*>', '', result)
-    result = re.sub(r'</body>$', '', result)
+    result = _BODY_OPEN_RE.sub('', result)
+    result = _BODY_CLOSE_RE.sub('', result)
     
     # === PHASE 2: String-based transforms for Quill format ===
     result = _convert_lists_to_quill_format(result, max_indent)
@@ -113,7 +141,7 @@ def _convert_headings_to_bullets(body) -> None:
                 <li data-list="bullet" class="ql-indent-1">item</li></ol>
     """
     LexborHTMLParser = _get_parser()
-    headings = body.css('h1, h2, h3, h4, h5, h6')
+    headings = body.css(_HEADING_SELECTOR)
     
     for heading in headings:
         # Get the heading text content
@@ -121,12 +149,12 @@ def _convert_headings_to_bullets(body) -> None:
         if not heading_text:
             continue
         
-        # Check if next sibling is a list
+        # Check if next element sibling is a list (DOM tag check, no string peek)
         next_elem = heading.next
         while next_elem and (next_elem.tag is None or next_elem.tag == '-text'):
             next_elem = next_elem.next
         
-        if next_elem and next_elem.tag in ('ul', 'ol'):
+        if next_elem and next_elem.tag in _LIST_TAGS:
             # Mark the list items as "heading children" (need extra indent)
             for li in next_elem.css('li'):
                 existing_class = li.attrs.get('class', '')
@@ -172,14 +200,14 @@ def _convert_lists_to_quill_format(html: str, max_indent: int = 1) -> str:
         attrs = match.group(1) or ''
         
         # Parse existing classes
-        class_match = re.search(r'class="([^"]*)"', attrs)
+        class_match = _CLASS_ATTR_RE.search(attrs)
         existing_classes = class_match.group(1) if class_match else ''
         
         # Check for heading markers
         is_heading_child = 'heading-child' in existing_classes
         
         # Determine indent level
-        indent_match = re.search(r'ql-indent-(\d+)', existing_classes)
+        indent_match = _QL_INDENT_RE.search(existing_classes)
         indent = int(indent_match.group(1)) if indent_match else 0
         
         if is_heading_child and indent == 0:
@@ -194,19 +222,18 @@ def _convert_lists_to_quill_format(html: str, max_indent: int = 1) -> str:
         return f'<li data-list="bullet"{class_attr}>'
     
     # Replace all <li> tags
-    html = re.sub(r'<li([^>]*)>', process_li, html)
+    html = _LI_OPEN_RE.sub(process_li, html)
     
     # Add ql-ui marker to li items that don't have it
-    html = re.sub(
-        r'(<li[^>]*>)(?!<span class="ql-ui">)',
-        r'\1<span class="ql-ui"></span>',
-        html
-    )
+    html = _LI_WITHOUT_UI_RE.sub(r'\1<span class="ql-ui"></span>', html)
     
-    # Clean up heading marker classes
-    html = re.sub(r'\s*heading-child\s*', '', html)
-    html = re.sub(r'\s*heading-parent\s*', '', html)
-    html = re.sub(r'class="\s*"', '', html)
+    # Clean up heading marker classes (the leading \s* makes these scans
+    # try every position, so skip them when no marker is present)
+    if 'heading-child' in html:
+        html = _HEADING_CHILD_RE.sub('', html)
+    if 'heading-parent' in html:
+        html = _HEADING_PARENT_RE.sub('', html)
+    html = _EMPTY_CLASS_RE.sub('', html)
     
     return html
 
@@ -216,14 +243,12 @@ def _secure_links(body) -> None:
     Ensure all links have proper security attributes.
     
     Adds target="_blank" and rel="noopener noreferrer" to external links.
+    The selector matches external links only, so internal/mailto links
+    are never visited.
     """
-    for link in body.css('a'):
-        href = link.attrs.get('href', '')
-        
-        # Only process external links
-        if href.startswith(('http://', 'https://')):
-            link.attrs['target'] = '_blank'
-            link.attrs['rel'] = 'noopener noreferrer'
+    for link in body.css(_EXTERNAL_LINK_SELECTOR):
+        link.attrs['target'] = '_blank'
+        link.attrs['rel'] = 'noopener noreferrer'
 
 
 def post_process_html(html: str) -> str:
@@ -237,20 +262,34 @@ def post_process_html(html: str) -> str:
     """
     # Normalize spacing around inline tags
     # Move trailing spaces from inside closing tags to outside
-    html = re.sub(r'\s+(</(?:strong|em|b|i|u)>)', r'\1 ', html)
+    html = _SPACE_BEFORE_CLOSE_RE.sub(r'\1 ', html)
     
     # Move leading spaces from inside opening tags to outside
-    html = re.sub(r'(<(?:strong|em|b|i|u)>)\s+', r' \1', html)
+    html = _SPACE_AFTER_OPEN_RE.sub(r' \1', html)
     
     # Clean up multiple spaces
-    html = re.sub(r'  +', ' ', html)
+    html = _MULTI_SPACE_RE.sub(' ', html)
     
     # Merge consecutive <ol> lists (from heading conversion)
-    html = re.sub(r'</ol>\s*<ol>', '', html)
+    html = _ADJACENT_OL_RE.sub('', html)
     
     return html
 
 
+def quill_metrics(html: str) -> Counter:
+    """
+    Count Quill structural markers in one pass over the HTML.
+    
+    Keys: '<li', 'data-list="bullet"', 'ql-ui', and 'ql-indent-N' per level.
+    A compliant list has equal '<li', 'data-list="bullet"' and 'ql-ui' counts.
+    """
+    counts: Counter = Counter()
+    for match in _COMPLIANCE_RE.finditer(html):
+        marker = match.group(0)
+        counts['ql-ui' if marker.startswith('<span') else marker] += 1
+    return counts
+
+
 def transform_and_clean(html: str, max_indent: int = 1) -> str:
     """
     Full transformation pipeline: transform + post-process.
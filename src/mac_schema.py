@@ -212,6 +212,19 @@ class ExtractedCV(BaseModel):
     website_url: Optional[str] = Field(None, description="Personal website URL")
 
 
+# Extracted skill categories that map to MAC hardSkills (others are soft)
+_HARD_SKILL_CATEGORIES = frozenset({"technical", "tool", "technology", "framework"})
+
+
+def _parse_location(location: str) -> dict:
+    """Parse a "City, Country" string into a MAC location dict."""
+    parts = [p.strip() for p in location.split(",")]
+    return {
+        "municipality": parts[0] if parts else None,
+        "country": parts[-1] if len(parts) > 1 else None,
+    }
+
+
 def extracted_cv_to_mac(extracted: ExtractedCV) -> dict:
     """
     Convert ExtractedCV (LLM-friendly) to MAC JSON (full schema).
@@ -229,12 +242,7 @@ def extracted_cv_to_mac(extracted: ExtractedCV) -> dict:
     if extracted.summary:
         profile["description"] = extracted.summary
     if extracted.location:
-        # Parse "City, Country" format
-        parts = [p.strip() for p in extracted.location.split(",")]
-        profile["location"] = {
-            "municipality": parts[0] if parts else None,
-            "country": parts[-1] if len(parts) > 1 else None,
-        }
+        profile["location"] = _parse_location(extracted.location)
     
     # Build relevant links
     relevant_links = []
@@ -248,19 +256,10 @@ def extracted_cv_to_mac(extracted: ExtractedCV) -> dict:
     # Build jobs
     jobs = []
     for job in extracted.jobs:
-        # Parse location
-        location = None
-        if job.location:
-            parts = [p.strip() for p in job.location.split(",")]
-            location = {
-                "municipality": parts[0] if parts else None,
-                "country": parts[-1] if len(parts) > 1 else None,
-            }
-        
         jobs.append({
             "organization": {
                 "name": job.company_name,
-                "location": location,
+                "location": _parse_location(job.location) if job.location else None,
             },
             "roles": [{
                 "name": job.job_title,
@@ -289,19 +288,17 @@ def extracted_cv_to_mac(extracted: ExtractedCV) -> dict:
         })
     
     # Build languages
-    languages = []
-    for lang in extracted.languages:
-        languages.append({
-            "name": lang.language,
-            "level": lang.level,
-        })
+    languages = [
+        {"name": lang.language, "level": lang.level}
+        for lang in extracted.languages
+    ]
     
     # Build skills
     hard_skills = []
     soft_skills = []
     for skill in extracted.skills:
         skill_entry = {"skill": {"name": skill.name}}
-        if skill.category in ("technical", "tool", "technology", "framework"):
+        if skill.category in _HARD_SKILL_CATEGORIES:
             hard_skills.append(skill_entry)
         else:
             soft_skills.append(skill_entry)
@@ -14,18 +14,53 @@ After:
       - Item 2
 """
 
+from functools import lru_cache
+
 from markdown_it import MarkdownIt
 from markdown_it.token import Token
 
+# Shared CommonMark parser: building one costs about as much as a parse, and
+# parse() keeps all state per call, so a single instance is reused
+_MD = MarkdownIt()
+
+# Parser for the Quill HTML renderer: raw HTML in the markdown must come out
+# escaped, never copied into the output, so the html option is off
+_MD_QUILL = MarkdownIt("commonmark", {"html": False})
+
+# Inputs longer than this bypass the memo cache (avoid pinning huge strings)
+_CACHE_MAX_CHARS = 64 * 1024
+
+# Precomputed "<indent>- " bullet prefixes, indexed by indent width in spaces
+_BULLET_PREFIXES = tuple(" " * width + "- " for width in range(33))
+
+
+def _bullet_prefix(indent: int) -> str:
+    """Return the bullet prefix for an indent width (cached up to 32 spaces)."""
+    if indent < len(_BULLET_PREFIXES):
+        return _BULLET_PREFIXES[indent]
+    return " " * indent + "- "
+
 
 def transform_headings_to_bullets(text: str) -> str:
     """
     Transform markdown headings followed by lists into nested bullet structure.
     
-    Uses markdown-it-py AST parsing (no regex).
+    Uses markdown-it-py AST parsing (no regex) with a shared module-level
+    parser. The transform is pure, so results are memoized: the same CV
+    section re-submitted during editing is only parsed once. Use
+    transform_headings_to_bullets.cache_clear() to reset the cache.
+    
+    Deprecated as a pre-pass before HTML rendering: use
+    markdown_to_quill_html_fused(), which does both in a single parse.
     """
-    md = MarkdownIt()
-    tokens = md.parse(text)
+    if len(text) > _CACHE_MAX_CHARS:
+        return _transform_headings_to_bullets(text)
+    return _transform_headings_to_bullets_cached(text)
+
+
+def _transform_headings_to_bullets(text: str) -> str:
+    """Uncached heading → bullet transform (see transform_headings_to_bullets)."""
+    tokens = _MD.parse(text)
     
     output_lines: list[str] = []
     heading_pending = False  # True if we just saw a heading
@@ -73,6 +108,11 @@ def transform_headings_to_bullets(text: str) -> str:
     return "\n".join(output_lines)
 
 
+_transform_headings_to_bullets_cached = lru_cache(maxsize=128)(_transform_headings_to_bullets)
+transform_headings_to_bullets.cache_clear = _transform_headings_to_bullets_cached.cache_clear
+transform_headings_to_bullets.cache_info = _transform_headings_to_bullets_cached.cache_info
+
+
 def find_matching_close(tokens: list[Token], start: int, open_type: str, close_type: str) -> int:
     """Find the index of the matching close token."""
     depth = 1
@@ -134,8 +174,7 @@ def process_list_item(tokens: list[Token], indent: int, output: list[str]) -> No
         if token.type == "bullet_list_open":
             # First output the current item text
             if item_text:
-                indent_str = " " * indent
-                output.append(f"{indent_str}- {item_text}")
+                output.append(_bullet_prefix(indent) + item_text)
                 item_text = None  # Already output
             
             # Find matching close
@@ -151,8 +190,186 @@ def process_list_item(tokens: list[Token], indent: int, output: list[str]) -> No
     
     # Output item text if not yet output (no nested list)
     if item_text:
-        indent_str = " " * indent
-        output.append(f"{indent_str}- {item_text}")
+        output.append(_bullet_prefix(indent) + item_text)
+
+
+# =============================================================================
+# Fused heading transform + Quill HTML rendering
+# =============================================================================
+
+# Quill supports indent levels 0-8 (ql-indent-N)
+_QUILL_MAX_INDENT = 8
+
+
+def _quill_li_opens(kind: str) -> tuple[str, ...]:
+    """Quill <li> opening markup for a data-list kind, indexed by indent level."""
+    return (f'<li data-list="{kind}"><span class="ql-ui"></span>',) + tuple(
+        f'<li data-list="{kind}" class="ql-indent-{level}"><span class="ql-ui"></span>'
+        for level in range(1, _QUILL_MAX_INDENT + 1)
+    )
+
+
+_QUILL_LI_OPEN = _quill_li_opens("bullet")
+
+# List open token type → (matching close token type, Quill <li> openers).
+# Both kinds share Quill's flat <ol>; only data-list differs
+_QUILL_LISTS = {
+    "bullet_list_open": ("bullet_list_close", _QUILL_LI_OPEN),
+    "ordered_list_open": ("ordered_list_close", _quill_li_opens("ordered")),
+}
+
+
+def markdown_to_quill_html_fused(text: str, *, headings_as_bullets: bool = True) -> str:
+    """
+    Render markdown to Europass/Quill HTML in a single parse.
+    
+    Fuses transform_headings_to_bullets() and Quill rendering: when a
+    heading is seen it is emitted directly as a bold level-0 bullet (and the
+    list that follows is indented one level), instead of first rewriting the
+    markdown source and parsing it again.
+    
+    Bullet and ordered lists become flat Quill items (data-list="bullet" /
+    "ordered"). Raw HTML in the markdown is escaped, not passed through.
+    
+    Args:
+        text: Markdown input
+        headings_as_bullets: Emit headings as bold bullets (default). If False,
+            headings render as <hN> elements.
+        
+    Returns:
+        Single-line Quill HTML (flat <ol>, data-list="bullet", ql-indent-N)
+    """
+    if not text or not text.strip():
+        return ""
+    
+    md = _MD_QUILL
+    tokens = md.parse(text)
+    
+    html_parts: list[str] = []
+    list_open = False
+    heading_pending = False  # True if we just emitted a heading bullet
+    
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        
+        # Heading → bold bullet parent (or <hN>)
+        if token.type == "heading_open":
+            inline = tokens[i + 1] if i + 1 < len(tokens) else None
+            if inline and inline.type == "inline":
+                content = _render_inline(md, inline)
+                if headings_as_bullets:
+                    if not list_open:
+                        html_parts.append("<ol>")
+                        list_open = True
+                    html_parts.append(f"{_QUILL_LI_OPEN[0]}<strong>{content}</strong></li>")
+                    heading_pending = True
+                else:
+                    if list_open:
+                        html_parts.append("</ol>")
+                        list_open = False
+                    html_parts.append(f"<{token.tag}>{content}</{token.tag}>")
+            i += 3
+            continue
+        
+        # Standalone paragraph (outside lists)
+        if token.type == "paragraph_open":
+            inline = tokens[i + 1] if i + 1 < len(tokens) else None
+            if inline and inline.type == "inline" and inline.content:
+                if list_open:
+                    html_parts.append("</ol>")
+                    list_open = False
+                html_parts.append(f"<p>{_render_inline(md, inline)}</p>")
+                heading_pending = False
+            i += 3
+            continue
+        
+        # Bullet/ordered list → flat Quill items; children of a heading start at level 1
+        if token.type in _QUILL_LISTS:
+            base_level = 1 if heading_pending else 0
+            heading_pending = False
+            
+            close_type, li_opens = _QUILL_LISTS[token.type]
+            close_idx = find_matching_close(tokens, i, token.type, close_type)
+            if not list_open:
+                html_parts.append("<ol>")
+                list_open = True
+            _render_quill_list(md, tokens[i+1:close_idx], base_level, li_opens, html_parts)
+            
+            i = close_idx + 1
+            continue
+        
+        i += 1
+    
+    if list_open:
+        html_parts.append("</ol>")
+    
+    return "".join(html_parts)
+
+
+def _render_inline(md: MarkdownIt, inline: Token) -> str:
+    """Render an inline token to HTML, securing external links."""
+    for child in inline.children or ():
+        if child.type == "link_open":
+            href = str(child.attrGet("href") or "")
+            if href.startswith(("http://", "https://")):
+                child.attrSet("target", "_blank")
+                child.attrSet("rel", "noopener noreferrer")
+    html = md.renderer.renderInline(inline.children or [], md.options, {})
+    # Soft line breaks would break the single-line Europass requirement
+    return html.replace("\n", " ")
+
+
+def _render_quill_list(
+    md: MarkdownIt, tokens: list[Token], level: int, li_opens: tuple[str, ...], output: list[str]
+) -> None:
+    """Render a list's inner tokens as flat Quill <li> items."""
+    i = 0
+    while i < len(tokens):
+        if tokens[i].type == "list_item_open":
+            close_idx = find_matching_close(tokens, i, "list_item_open", "list_item_close")
+            _render_quill_list_item(md, tokens[i+1:close_idx], level, li_opens, output)
+            i = close_idx + 1
+            continue
+        i += 1
+
+
+def _render_quill_list_item(
+    md: MarkdownIt, tokens: list[Token], level: int, li_opens: tuple[str, ...], output: list[str]
+) -> None:
+    """Render a single list item (and any nested list at level + 1)."""
+    li_open = li_opens[min(level, _QUILL_MAX_INDENT)]
+    item_html = None
+    i = 0
+    
+    while i < len(tokens):
+        token = tokens[i]
+        
+        # Get the item's text from its first paragraph
+        if token.type == "paragraph_open":
+            inline = tokens[i + 1] if i + 1 < len(tokens) else None
+            if inline and inline.type == "inline" and item_html is None:
+                item_html = _render_inline(md, inline)
+            i += 3
+            continue
+        
+        # Nested bullet/ordered list
+        if token.type in _QUILL_LISTS:
+            if item_html:
+                output.append(f"{li_open}{item_html}</li>")
+                item_html = None  # Already output
+            
+            close_type, nested_li_opens = _QUILL_LISTS[token.type]
+            close_idx = find_matching_close(tokens, i, token.type, close_type)
+            _render_quill_list(md, tokens[i+1:close_idx], level + 1, nested_li_opens, output)
+            
+            i = close_idx + 1
+            continue
+        
+        i += 1
+    
+    if item_html:
+        output.append(f"{li_open}{item_html}</li>")
 
 
 def test_transform():
@@ -11,12 +11,16 @@ Supported input formats:
 
 import asyncio
 import logging
+import re
+import secrets
+import sys
 import time
+import unicodedata
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
-from uuid import uuid4
-from xml.sax.saxutils import escape
 
 import phonenumbers
 import pypdf
@@ -32,6 +36,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns (module-level to skip the re cache lookup per call)
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_GIVEN_NAME_RE = re.compile(r'<oa:GivenName>([^<]+)</oa:GivenName>')
+_FAMILY_NAME_RE = re.compile(r'<hr:FamilyName>([^<]+)</hr:FamilyName>')
+
 # Europass configuration
 EUROPASS_URL = "https://europa.eu/europass/eportfolio/screen/cv-editor?lang=fr"
 DEFAULT_TEMPLATE = "cv-formal"
@@ -68,8 +77,8 @@ mcp = FastMCP(
     """,
 )
 
-# Storage for resumes by ID (session-safe)
-_resumes: dict[str, dict[str, Any]] = {}
+# Storage for resumes by ID (session-safe), oldest write first
+_resumes: OrderedDict[str, dict[str, Any]] = OrderedDict()
 
 # Storage for raw Europass XML by resume ID (bypasses MAC conversion)
 _raw_europass_xml: dict[str, str] = {}
@@ -78,6 +87,14 @@ _raw_europass_xml: dict[str, str] = {}
 _MAX_RESUMES = 50
 
 
+def _new_resume_id() -> str:
+    """Return a random 8-hex-char resume ID not already in use."""
+    while True:
+        resume_id = secrets.token_hex(4)
+        if resume_id not in _resumes:
+            return resume_id
+
+
 @mcp.tool
 def parse_document(file_path: str) -> dict[str, Any] | str:
     """
@@ -169,7 +186,6 @@ def _europass_xml_to_mac(xml_content: str) -> dict[str, Any]:
     - All location details (postal code, address, city)
     - Education descriptions
     """
-    import re
     import html
     from xml.etree import ElementTree as ET
     
@@ -576,7 +592,6 @@ def import_cv(file_path: str, parse_to_mac: bool = True) -> dict[str, Any]:
         - summary: Quick overview of extracted data
     """
     global _resumes, _raw_europass_xml
-    import re
     
     path = Path(file_path)
     
@@ -612,7 +627,7 @@ def import_cv(file_path: str, parse_to_mac: bool = True) -> dict[str, Any]:
                     
                     if extraction_result.get("status") == "success":
                         # Store the MAC JSON
-                        resume_id = str(uuid4())[:8]
+                        resume_id = _new_resume_id()
                         mac = extraction_result["mac_json"]
                         mac["_imported_from"] = str(file_path)
                         _resumes[resume_id] = mac
@@ -679,7 +694,7 @@ def import_cv(file_path: str, parse_to_mac: bool = True) -> dict[str, Any]:
                         extraction_result = extract_cv_from_text(text_content)
                         
                         if extraction_result.get("status") == "success":
-                            resume_id = str(uuid4())[:8]
+                            resume_id = _new_resume_id()
                             mac = extraction_result["mac_json"]
                             mac["_imported_from"] = str(file_path)
                             _resumes[resume_id] = mac
@@ -747,7 +762,7 @@ def import_cv(file_path: str, parse_to_mac: bool = True) -> dict[str, Any]:
     
     try:
         # Generate unique ID
-        resume_id = str(uuid4())[:8]
+        resume_id = _new_resume_id()
         
         # Always store the raw XML for direct use option
         _raw_europass_xml[resume_id] = xml_content
@@ -784,8 +799,8 @@ def import_cv(file_path: str, parse_to_mac: bool = True) -> dict[str, Any]:
         else:
             # Direct mode - use XML as-is
             # Extract name from XML for summary
-            given_name_match = re.search(r'<oa:GivenName>([^<]+)</oa:GivenName>', xml_content)
-            family_name_match = re.search(r'<hr:FamilyName>([^<]+)</hr:FamilyName>', xml_content)
+            given_name_match = _GIVEN_NAME_RE.search(xml_content)
+            family_name_match = _FAMILY_NAME_RE.search(xml_content)
             
             given_name = given_name_match.group(1).strip() if given_name_match else "Unknown"
             family_name = family_name_match.group(1).strip() if family_name_match else "Unknown"
@@ -943,15 +958,15 @@ def create_resume(mac_json: dict[str, Any]) -> dict[str, Any]:
         }
     
     # Generate unique ID for this resume
-    resume_id = str(uuid4())[:8]
+    resume_id = _new_resume_id()
+    
+    _resumes[resume_id] = mac_json
     
-    # LRU-style cleanup: remove oldest if at capacity
-    if len(_resumes) >= _MAX_RESUMES:
-        oldest_id = next(iter(_resumes))
-        del _resumes[oldest_id]
+    # LRU-style cleanup: drop oldest entries beyond capacity
+    while len(_resumes) > _MAX_RESUMES:
+        oldest_id, _ = _resumes.popitem(last=False)
         logger.debug(f"Cleaned up old resume: {oldest_id}")
     
-    _resumes[resume_id] = mac_json
     logger.info(f"Resume created: {resume_id} for {name} {surnames}")
     
     # Extract summary info
@@ -1077,7 +1092,8 @@ def update_resume(resume_id: str, mac_json: dict[str, Any], use_mac_conversion:
         else:
             existing[key] = value
     
-    _resumes[resume_id] = existing
+    # Updated resume becomes the most recent one
+    _resumes.move_to_end(resume_id)
     
     # Clear raw XML if user wants MAC conversion
     if use_mac_conversion and resume_id in _raw_europass_xml:
@@ -1096,11 +1112,85 @@ def update_resume(resume_id: str, mac_json: dict[str, Any], use_mac_conversion:
     }
 
 
+# XML text escaping in a single pass (apostrophes are left as-is)
+_XML_ESC = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
+
+# Static Europass XML fragments (one entry per output line)
+_XML_PROLOG = (
+    '<?xml version="1.0" encoding="utf-8"?>',
+    '<Candidate xmlns="http://www.europass.eu/1.0" xmlns:eures="http://www.europass_eures.eu/1.0" xmlns:hr="http://www.hr-xml.org/3" xmlns:oa="http://www.openapplications.org/oagis/9" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:schemaLocation="http://www.europass.eu/1.0 Candidate.xsd">',
+)
+
+_XML_SUPPLIER_OPEN = (
+    '    <CandidateSupplier>',
+    '        <hr:PartyID schemeID="MAC-001" schemeName="PartyID" schemeAgencyName="EUROPASS" schemeVersionID="1.0" />',
+    '        <hr:PartyName>Owner</hr:PartyName>',
+    '        <PersonContact>',
+    '            <PersonName>',
+)
+
+_XML_PLACEHOLDER_SECTIONS = (
+    '        <CreativeWorks />',
+    '        <Projects />',
+    '        <SocialAndPoliticalActivities />',
+    '        <Skills />',
+    '        <NetworksAndMemberships />',
+    '        <ConferencesAndSeminars />',
+    '        <VoluntaryWorks />',
+    '        <CourseCertifications />',
+)
+
+_XML_RENDERING_INFO = (
+    '    <RenderingInformation>',
+    '        <Design>',
+    '            <Template>Template3</Template>',
+    '            <Color>Default</Color>',
+    '            <FontSize>Medium</FontSize>',
+    '            <Logo>FirstPage</Logo>',
+    '            <PageNumbers>false</PageNumbers>',
+    '            <SectionsOrder>',
+    '                <Section>',
+    '                    <Title>work-experience</Title>',
+    '                </Section>',
+    '                <Section>',
+    '                    <Title>education-training</Title>',
+    '                </Section>',
+    '                <Section>',
+    '                    <Title>language</Title>',
+    '                </Section>',
+    '            </SectionsOrder>',
+    '        </Design>',
+    '    </RenderingInformation>',
+    '</Candidate>',
+)
+
+# CEF self-assessment dimensions emitted for every language
+_CEF_DIMENSIONS = (
+    "CEF-Understanding-Listening",
+    "CEF-Understanding-Reading",
+    "CEF-Speaking-Interaction",
+    "CEF-Speaking-Production",
+    "CEF-Writing-Production",
+)
+
+# First 3 chars of the primary language name -> ISO 639-2 code
+_PRIMARY_LANG_CODES = {
+    "fr": "fre", "fra": "fre", "fre": "fre",
+    "en": "eng", "eng": "eng",
+    "de": "deu", "deu": "deu", "ger": "deu",
+    "es": "spa", "spa": "spa",
+    "it": "ita", "ita": "ita",
+    "pt": "por", "por": "por",
+    "nl": "nld", "nld": "nld", "dut": "nld",
+}
+
+
 def _mac_to_europass_xml(mac: dict[str, Any]) -> str:
     """
     Convert MAC JSON to Europass XML format.
     
-    Maps MAC structure to EURES/HR-XML based Europass schema.
+    Maps MAC structure to EURES/HR-XML based Europass schema. Lines are
+    accumulated in a list and joined once at the end.
     """
     profile = mac.get("aboutMe", {}).get("profile", {})
     contact = mac.get("careerPreferences", {}).get("contact", {})
@@ -1140,32 +1230,29 @@ def _mac_to_europass_xml(mac: dict[str, Any]) -> str:
     
     # Build XML
     xml_parts = [
-        '<?xml version="1.0" encoding="utf-8"?>',
-        '<Candidate xmlns="http://www.europass.eu/1.0" xmlns:eures="http://www.europass_eures.eu/1.0" xmlns:hr="http://www.hr-xml.org/3" xmlns:oa="http://www.openapplications.org/oagis/9" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:schemaLocation="http://www.europass.eu/1.0 Candidate.xsd">',
+        *_XML_PROLOG,
         f'    <hr:DocumentID schemeID="MAC-{datetime.now().strftime("%Y%m%d")}" schemeName="DocumentIdentifier" schemeAgencyName="EUROPASS" schemeVersionID="4.0" />',
     ]
+    append = xml_parts.append
+    extend = xml_parts.extend
     
     # CandidateSupplier
-    xml_parts.extend([
-        '    <CandidateSupplier>',
-        '        <hr:PartyID schemeID="MAC-001" schemeName="PartyID" schemeAgencyName="EUROPASS" schemeVersionID="1.0" />',
-        '        <hr:PartyName>Owner</hr:PartyName>',
-        '        <PersonContact>',
-        '            <PersonName>',
-        f'                <oa:GivenName>{escape(name)}</oa:GivenName>',
-        f'                <hr:FamilyName>{escape(surnames)}</hr:FamilyName>',
+    extend(_XML_SUPPLIER_OPEN)
+    extend([
+        f'                <oa:GivenName>{name.translate(_XML_ESC)}</oa:GivenName>',
+        f'                <hr:FamilyName>{surnames.translate(_XML_ESC)}</hr:FamilyName>',
         '            </PersonName>',
     ])
     
     if email:
-        xml_parts.extend([
+        extend([
             '            <Communication>',
             '                <ChannelCode>Email</ChannelCode>',
-            f'                <oa:URI>{escape(email)}</oa:URI>',
+            f'                <oa:URI>{email.translate(_XML_ESC)}</oa:URI>',
             '            </Communication>',
         ])
     
-    xml_parts.extend([
+    extend([
         '        </PersonContact>',
         '        <hr:PrecedenceCode>1</hr:PrecedenceCode>',
         '    </CandidateSupplier>',
@@ -1175,18 +1262,18 @@ def _mac_to_europass_xml(mac: dict[str, Any]) -> str:
     # Note: PersonTitle and PersonDescription are NOT supported by Europass XML import
     # The working original XML does not include these elements
 
-    xml_parts.extend([
+    extend([
         '    <CandidatePerson>',
         '        <PersonName>',
-        f'            <oa:GivenName>{escape(name)}</oa:GivenName>',
-        f'            <hr:FamilyName>{escape(surnames)}</hr:FamilyName>',
+        f'            <oa:GivenName>{name.translate(_XML_ESC)}</oa:GivenName>',
+        f'            <hr:FamilyName>{surnames.translate(_XML_ESC)}</hr:FamilyName>',
         '        </PersonName>',
     ])
     if email:
-        xml_parts.extend([
+        extend([
             '        <Communication>',
             '            <ChannelCode>Email</ChannelCode>',
-            f'            <oa:URI>{escape(email)}</oa:URI>',
+            f'            <oa:URI>{email.translate(_XML_ESC)}</oa:URI>',
             '        </Communication>',
         ])
     
@@ -1197,10 +1284,10 @@ def _mac_to_europass_xml(mac: dict[str, Any]) -> str:
     for link in relevant_links:
         url = link.get("URL", "")
         if url:
-            xml_parts.extend([
+            extend([
                 '        <Communication>',
                 '            <ChannelCode>Web</ChannelCode>',
-                f'            <oa:URI>{escape(url)}</oa:URI>',
+                f'            <oa:URI>{url.translate(_XML_ESC)}</oa:URI>',
                 '        </Communication>',
             ])
     
@@ -1235,12 +1322,12 @@ def _mac_to_europass_xml(mac: dict[str, Any]) -> str:
         # Get country code from phone country dialing code
         phone_country = _phone_country_to_iso(country_code)
         
-        xml_parts.extend([
+        extend([
             '        <Communication>',
             '            <ChannelCode>Telephone</ChannelCode>',
             '            <UseCode>work</UseCode>',
-            f'            <CountryDialing>{escape(country_code)}</CountryDialing>',
-            f'            <oa:DialNumber>{escape(number)}</oa:DialNumber>',
+            f'            <CountryDialing>{country_code.translate(_XML_ESC)}</CountryDialing>',
+            f'            <oa:DialNumber>{number.translate(_XML_ESC)}</oa:DialNumber>',
             f'            <CountryCode>{phone_country}</CountryCode>',
             '        </Communication>',
         ])
@@ -1257,50 +1344,42 @@ def _mac_to_europass_xml(mac: dict[str, Any]) -> str:
         # Use address if available, fallback to region
         display_address = address_line if address_line else region
         
-        xml_parts.extend([
+        extend([
             '        <Communication>',
             '            <UseCode>home</UseCode>',
             '            <Address type="home">',
-            f'                <oa:AddressLine>{escape(display_address)}</oa:AddressLine>',
-            f'                <oa:CityName>{escape(city)}</oa:CityName>',
+            f'                <oa:AddressLine>{display_address.translate(_XML_ESC)}</oa:AddressLine>',
+            f'                <oa:CityName>{city.translate(_XML_ESC)}</oa:CityName>',
             f'                <CountryCode>{country_code}</CountryCode>',
         ])
         if postal_code:
-            xml_parts.append(f'                <oa:PostalCode>{escape(postal_code)}</oa:PostalCode>')
-        xml_parts.extend([
+            append(f'                <oa:PostalCode>{postal_code.translate(_XML_ESC)}</oa:PostalCode>')
+        extend([
             '            </Address>',
             '        </Communication>',
         ])
     
     # Nationality and birth date
     nationality = _country_to_code(location.get("country", ""))
-    xml_parts.append(f'        <NationalityCode>{nationality}</NationalityCode>')
+    append(f'        <NationalityCode>{nationality}</NationalityCode>')
     
     if birthday:
-        xml_parts.append(f'        <hr:BirthDate>{birthday}</hr:BirthDate>')
+        append(f'        <hr:BirthDate>{birthday}</hr:BirthDate>')
     
     # Primary language - use first language from knowledge.languages (native/primary)
     languages = knowledge.get("languages", [])
     if languages:
         first_lang = languages[0].get("name", "").lower()[:3]
         # Map to ISO 639-2 codes
-        primary_lang = {
-            "fr": "fre", "fra": "fre", "fre": "fre",
-            "en": "eng", "eng": "eng",
-            "de": "deu", "deu": "deu", "ger": "deu",
-            "es": "spa", "spa": "spa",
-            "it": "ita", "ita": "ita",
-            "pt": "por", "por": "por",
-            "nl": "nld", "nld": "nld", "dut": "nld",
-        }.get(first_lang, first_lang)
+        primary_lang = _PRIMARY_LANG_CODES.get(first_lang, first_lang)
     else:
         # Fallback to document language
         primary_lang = "eng" if lang_code == "en" else "fre" if lang_code == "fr" else lang_code
-    xml_parts.append(f'        <PrimaryLanguageCode name="NORMAL">{primary_lang}</PrimaryLanguageCode>')
-    xml_parts.append('    </CandidatePerson>')
+    append(f'        <PrimaryLanguageCode name="NORMAL">{primary_lang}</PrimaryLanguageCode>')
+    append('    </CandidatePerson>')
     
     # CandidateProfile
-    xml_parts.extend([
+    extend([
         f'    <CandidateProfile languageCode="{lang_code}">',
         '        <hr:ID schemeID="MAC-001" schemeName="CandidateProfileID" schemeAgencyName="EUROPASS" schemeVersionID="1.0" />',
     ])
@@ -1308,7 +1387,7 @@ def _mac_to_europass_xml(mac: dict[str, Any]) -> str:
     # Employment History
     jobs = experience.get("jobs", [])
     if jobs:
-        xml_parts.append('        <EmploymentHistory>')
+        append('        <EmploymentHistory>')
         for job in jobs:
             org = job.get("organization", {})
             org_name = org.get("name", "")
@@ -1317,6 +1396,38 @@ def _mac_to_europass_xml(mac: dict[str, Any]) -> str:
             org_country = _country_to_code(org_address.get("country", ""))
             org_city = org_address.get("municipality", org_address.get("city", ""))
             
+            # Organization lines are the same for every role of this job:
+            # build them once per job instead of once per role
+            org_head = [
+                '            <EmployerHistory>',
+                f'                <hr:OrganizationName>{org_name.translate(_XML_ESC)}</hr:OrganizationName>',
+                '                <OrganizationContact>',
+                '                    <Communication>',
+            ]
+            # Only add Address block if we have city or country data
+            if org_city or org_country:
+                org_head.append('                        <Address>')
+                if org_city:
+                    org_head.append(f'                            <oa:CityName>{org_city.translate(_XML_ESC)}</oa:CityName>')
+                if org_country:
+                    org_head.append(f'                            <CountryCode>{org_country}</CountryCode>')
+                org_head.append('                        </Address>')
+            org_head.extend([
+                '                    </Communication>',
+                '                </OrganizationContact>',
+                '                <PositionHistory>',
+            ])
+            # City and Country inside PositionHistory (required by Europass)
+            org_tail = []
+            if org_city:
+                org_tail.append(f'                    <City>{org_city.translate(_XML_ESC)}</City>')
+            if org_country:
+                org_tail.append(f'                    <Country>{org_country}</Country>')
+            org_tail.extend([
+                '                </PositionHistory>',
+                '            </EmployerHistory>',
+            ])
+            
             for role in job.get("roles", []):
                 role_name = role.get("name", "")
                 start_date = _validate_date(role.get("startDate", ""))
@@ -1333,25 +1444,9 @@ def _mac_to_europass_xml(mac: dict[str, Any]) -> str:
                     challenges = role.get("challenges", [])
                     description = _build_html_description(challenges)
                 
-                xml_parts.extend([
-                    '            <EmployerHistory>',
-                    f'                <hr:OrganizationName>{escape(org_name)}</hr:OrganizationName>',
-                    '                <OrganizationContact>',
-                    '                    <Communication>',
-                ])
-                # Only add Address block if we have city or country data
-                if org_city or org_country:
-                    xml_parts.append('                        <Address>')
-                    if org_city:
-                        xml_parts.append(f'                            <oa:CityName>{escape(org_city)}</oa:CityName>')
-                    if org_country:
-                        xml_parts.append(f'                            <CountryCode>{org_country}</CountryCode>')
-                    xml_parts.append('                        </Address>')
-                xml_parts.extend([
-                    '                    </Communication>',
-                    '                </OrganizationContact>',
-                    '                <PositionHistory>',
-                    f'                    <PositionTitle typeCode="FREETEXT">{escape(role_name)}</PositionTitle>',
+                extend(org_head)
+                extend([
+                    f'                    <PositionTitle typeCode="FREETEXT">{role_name.translate(_XML_ESC)}</PositionTitle>',
                     '                    <eures:EmploymentPeriod>',
                     '                        <eures:StartDate>',
                     f'                            <hr:FormattedDateTime>{start_date}</hr:FormattedDateTime>',
@@ -1359,28 +1454,20 @@ def _mac_to_europass_xml(mac: dict[str, Any]) -> str:
                 ])
                 
                 if finish_date:
-                    xml_parts.extend([
+                    extend([
                         '                        <eures:EndDate>',
                         f'                            <hr:FormattedDateTime>{finish_date}</hr:FormattedDateTime>',
                         '                        </eures:EndDate>',
                     ])
                 
-                xml_parts.extend([
+                extend([
                     f'                        <hr:CurrentIndicator>{"true" if is_current else "false"}</hr:CurrentIndicator>',
                     '                    </eures:EmploymentPeriod>',
-                    f'                    <oa:Description>{escape(description)}</oa:Description>',
-                ])
-                # Add City and Country inside PositionHistory (required by Europass)
-                if org_city:
-                    xml_parts.append(f'                    <City>{escape(org_city)}</City>')
-                if org_country:
-                    xml_parts.append(f'                    <Country>{org_country}</Country>')
-                xml_parts.extend([
-                    '                </PositionHistory>',
-                    '            </EmployerHistory>',
+                    f'                    <oa:Description>{description.translate(_XML_ESC)}</oa:Description>',
                 ])
+                extend(org_tail)
         
-        xml_parts.append('        </EmploymentHistory>')
+        append('        </EmploymentHistory>')
     
     # Education History - Europass puts ALL education here (degrees + certifications)
     # The separate Certifications section is optional and often empty
@@ -1392,7 +1479,7 @@ def _mac_to_europass_xml(mac: dict[str, Any]) -> str:
         studies = studies_raw
     # Include ALL studies (both education and certifications go in EducationHistory in Europass)
     if studies:
-        xml_parts.append('        <EducationHistory>')
+        append('        <EducationHistory>')
         for study in studies:
             institution = study.get("institution", {})
             inst_name = institution.get("name", "")
@@ -1407,33 +1494,33 @@ def _mac_to_europass_xml(mac: dict[str, Any]) -> str:
             finish_date = _validate_date(study.get("finishDate", ""))
             description = study.get("description", "")
             
-            xml_parts.extend([
+            extend([
                 '            <EducationOrganizationAttendance>',
-                f'                <hr:OrganizationName>{escape(inst_name)}</hr:OrganizationName>',
+                f'                <hr:OrganizationName>{inst_name.translate(_XML_ESC)}</hr:OrganizationName>',
                 '                <OrganizationContact>',
                 '                    <Communication>',
             ])
             # Only add Address block if we have city or country data
             if inst_city or inst_country:
-                xml_parts.append('                        <Address>')
+                append('                        <Address>')
                 if inst_city:
-                    xml_parts.append(f'                            <oa:CityName>{escape(inst_city)}</oa:CityName>')
+                    append(f'                            <oa:CityName>{inst_city.translate(_XML_ESC)}</oa:CityName>')
                 if inst_country:
-                    xml_parts.append(f'                            <CountryCode>{inst_country}</CountryCode>')
-                xml_parts.append('                        </Address>')
-            xml_parts.extend([
+                    append(f'                            <CountryCode>{inst_country}</CountryCode>')
+                append('                        </Address>')
+            extend([
                 '                    </Communication>',
             ])
             
             if inst_url:
-                xml_parts.extend([
+                extend([
                     '                    <Communication>',
                     '                        <ChannelCode>Web</ChannelCode>',
-                    f'                        <oa:URI>{escape(inst_url)}</oa:URI>',
+                    f'                        <oa:URI>{inst_url.translate(_XML_ESC)}</oa:URI>',
                     '                    </Communication>',
                 ])
             
-            xml_parts.extend([
+            extend([
                 '                </OrganizationContact>',
                 '                <AttendancePeriod>',
                 '                    <StartDate>',
@@ -1445,55 +1532,55 @@ def _mac_to_europass_xml(mac: dict[str, Any]) -> str:
                 f'                    <Ongoing>{"true" if not finish_date else "false"}</Ongoing>',
                 '                </AttendancePeriod>',
                 '                <EducationDegree>',
-                f'                    <hr:DegreeName>{escape(degree_name)}</hr:DegreeName>',
+                f'                    <hr:DegreeName>{degree_name.translate(_XML_ESC)}</hr:DegreeName>',
             ])
             
             if description:
-                xml_parts.append(f'                    <OccupationalSkillsCovered>{escape(description)}</OccupationalSkillsCovered>')
+                append(f'                    <OccupationalSkillsCovered>{description.translate(_XML_ESC)}</OccupationalSkillsCovered>')
             
-            xml_parts.extend([
+            extend([
                 '                </EducationDegree>',
                 '            </EducationOrganizationAttendance>',
             ])
         
-        xml_parts.append('        </EducationHistory>')
+        append('        </EducationHistory>')
     
     # Licenses section (required placeholder for Europass compatibility)
-    xml_parts.append('        <eures:Licenses />')
+    append('        <eures:Licenses />')
     
     # Certifications (from studies with type "certification")
     certifications = [s for s in studies if s.get("studyType") == "certification"]
     if certifications:
-        xml_parts.append('        <Certifications>')
+        append('        <Certifications>')
         for cert in certifications:
             cert_name = cert.get("name", "")
             issuer = cert.get("institution", {}).get("name", "")
             date = _validate_date(cert.get("finishDate", cert.get("startDate", "")))
             description = cert.get("description", "")
             
-            xml_parts.extend([
+            extend([
                 '            <Certification>',
-                f'                <hr:CertificationName>{escape(cert_name)}</hr:CertificationName>',
-                f'                <hr:IssuingAuthority>{escape(issuer)}</hr:IssuingAuthority>',
+                f'                <hr:CertificationName>{cert_name.translate(_XML_ESC)}</hr:CertificationName>',
+                f'                <hr:IssuingAuthority>{issuer.translate(_XML_ESC)}</hr:IssuingAuthority>',
             ])
             
             if description:
-                xml_parts.append(f'                <hr:CertificationDescription>{escape(description)}</hr:CertificationDescription>')
+                append(f'                <hr:CertificationDescription>{description.translate(_XML_ESC)}</hr:CertificationDescription>')
             
             # CertificationDate is required even if empty
-            xml_parts.append('                <hr:CertificationDate>')
+            append('                <hr:CertificationDate>')
             if date:
-                xml_parts.append(f'                    <hr:FormattedDateTime>{date}</hr:FormattedDateTime>')
-            xml_parts.append('                </hr:CertificationDate>')
+                append(f'                    <hr:FormattedDateTime>{date}</hr:FormattedDateTime>')
+            append('                </hr:CertificationDate>')
             
-            xml_parts.append('            </Certification>')
+            append('            </Certification>')
         
-        xml_parts.append('        </Certifications>')
+        append('        </Certifications>')
     
     # Languages
     languages = knowledge.get("languages", [])
     if languages:
-        xml_parts.append('        <PersonQualifications>')
+        append('        <PersonQualifications>')
         for lang in languages:
             lang_name = lang.get("name", "").lower()
             # Map language names to ISO 639-2/B codes (used by Europass)
@@ -1503,17 +1590,16 @@ def _mac_to_europass_xml(mac: dict[str, Any]) -> str:
             # Get preserved CEFR scores if available, otherwise use default level for all
             cefr_scores = lang.get("cefrScores", {})
             
-            xml_parts.extend([
+            extend([
                 '            <PersonCompetency>',
                 f'                <CompetencyID schemeName="NORMAL">{lang_code}</CompetencyID>',
                 '                <hr:TaxonomyID>language</hr:TaxonomyID>',
             ])
             
-            for dim in ["CEF-Understanding-Listening", "CEF-Understanding-Reading", 
-                       "CEF-Speaking-Interaction", "CEF-Speaking-Production", "CEF-Writing-Production"]:
+            for dim in _CEF_DIMENSIONS:
                 # Use preserved score if available, otherwise use default
                 score = cefr_scores.get(dim, default_level)
-                xml_parts.extend([
+                extend([
                     '                <eures:CompetencyDimension>',
                     f'                    <hr:CompetencyDimensionTypeCode>{dim}</hr:CompetencyDimensionTypeCode>',
                     '                    <eures:Score>',
@@ -1522,26 +1608,26 @@ def _mac_to_europass_xml(mac: dict[str, Any]) -> str:
                     '                </eures:CompetencyDimension>',
                 ])
             
-            xml_parts.append('            </PersonCompetency>')
+            append('            </PersonCompetency>')
         
         # NOTE: Hard/soft skills removed - Europass only supports language competencies
         # with schemeName="NORMAL" and TaxonomyID="language". Using HARDSKILL/SOFTSKILL
         # causes the Europass parser to fail silently.
         # _add_skills_to_xml(xml_parts, knowledge)
         
-        xml_parts.append('        </PersonQualifications>')
+        append('        </PersonQualifications>')
     
     # NOTE: Removed skills-only section - Europass doesn't support HARDSKILL/SOFTSKILL
     # if not languages and (knowledge.get("hardSkills") or knowledge.get("softSkills")):
-    #     xml_parts.append('        <PersonQualifications>')
+    #     append('        <PersonQualifications>')
     #     _add_skills_to_xml(xml_parts, knowledge)
-    #     xml_parts.append('        </PersonQualifications>')
+    #     append('        </PersonQualifications>')
     
-    xml_parts.append('        <EmploymentReferences />')
+    append('        <EmploymentReferences />')
     
     # Add profile picture attachment if available
     if profile_picture:
-        xml_parts.extend([
+        extend([
             '        <eures:Attachment>',
             f'            <oa:EmbeddedData>{profile_picture}</oa:EmbeddedData>',
             '            <oa:FileType>photo</oa:FileType>',
@@ -1550,239 +1636,177 @@ def _mac_to_europass_xml(mac: dict[str, Any]) -> str:
         ])
     
     # Empty placeholder sections for Europass compatibility
-    xml_parts.extend([
-        '        <CreativeWorks />',
-        '        <Projects />',
-        '        <SocialAndPoliticalActivities />',
-        '        <Skills />',
-        '        <NetworksAndMemberships />',
-        '        <ConferencesAndSeminars />',
-        '        <VoluntaryWorks />',
-        '        <CourseCertifications />',
-    ])
+    extend(_XML_PLACEHOLDER_SECTIONS)
     
-    xml_parts.append('    </CandidateProfile>')
+    append('    </CandidateProfile>')
     
     # RenderingInformation section for template settings
-    xml_parts.extend([
-        '    <RenderingInformation>',
-        '        <Design>',
-        '            <Template>Template3</Template>',
-        '            <Color>Default</Color>',
-        '            <FontSize>Medium</FontSize>',
-        '            <Logo>FirstPage</Logo>',
-        '            <PageNumbers>false</PageNumbers>',
-        '            <SectionsOrder>',
-        '                <Section>',
-        '                    <Title>work-experience</Title>',
-        '                </Section>',
-        '                <Section>',
-        '                    <Title>education-training</Title>',
-        '                </Section>',
-        '                <Section>',
-        '                    <Title>language</Title>',
-        '                </Section>',
-        '            </SectionsOrder>',
-        '        </Design>',
-        '    </RenderingInformation>',
-        '</Candidate>',
-    ])
+    extend(_XML_RENDERING_INFO)
     
     return '\n'.join(xml_parts)
 
 
+# Country name (lowercase) -> ISO 2-letter code, lowercase for Europass compatibility
+_COUNTRY_NAME_TO_ISO = {
+    # Full names - all lowercase ISO codes for Europass
+    "france": "fr",
+    "united states": "us",
+    "united states of america": "us",
+    "usa": "us",
+    "united kingdom": "gb",
+    "uk": "gb",
+    "great britain": "gb",
+    "germany": "de",
+    "deutschland": "de",
+    "spain": "es",
+    "españa": "es",
+    "italy": "it",
+    "italia": "it",
+    "belgium": "be",
+    "belgique": "be",
+    "netherlands": "nl",
+    "pays-bas": "nl",
+    "switzerland": "ch",
+    "suisse": "ch",
+    "portugal": "pt",
+    "austria": "at",
+    "poland": "pl",
+    "ireland": "ie",
+    "sweden": "se",
+    "norway": "no",
+    "denmark": "dk",
+    "finland": "fi",
+    "greece": "gr",
+    "czech republic": "cz",
+    "czechia": "cz",
+    "hungary": "hu",
+    "romania": "ro",
+    "bulgaria": "bg",
+    "croatia": "hr",
+    "slovakia": "sk",
+    "slovenia": "si",
+    "luxembourg": "lu",
+    "canada": "ca",
+    "australia": "au",
+    "japan": "jp",
+    "china": "cn",
+    "india": "in",
+    "brazil": "br",
+    "mexico": "mx",
+}
+
+# Known ISO 2-letter region codes (lowercase); "uk" is not one and maps via the names.
+# Table values below are string literals (interned by the compiler); computed codes
+# are interned explicitly so every returned code is a shared object.
+_ISO2_CODES = frozenset(sys.intern(region.lower()) for region in phonenumbers.SUPPORTED_REGIONS)
+
+# Phone country dialing code -> ISO 2-letter country code (lowercase)
+_PHONE_CODE_TO_ISO = {
+    "1": "us",    # US/Canada - default to US
+    "33": "fr",   # France
+    "44": "gb",   # UK
+    "49": "de",   # Germany
+    "34": "es",   # Spain
+    "39": "it",   # Italy
+    "32": "be",   # Belgium
+    "31": "nl",   # Netherlands
+    "41": "ch",   # Switzerland
+    "351": "pt",  # Portugal
+    "43": "at",   # Austria
+    "48": "pl",   # Poland
+    "353": "ie",  # Ireland
+    "46": "se",   # Sweden
+    "47": "no",   # Norway
+    "45": "dk",   # Denmark
+    "358": "fi",  # Finland
+    "30": "gr",   # Greece
+    "420": "cz",  # Czech Republic
+    "36": "hu",   # Hungary
+    "40": "ro",   # Romania
+    "359": "bg",  # Bulgaria
+    "385": "hr",  # Croatia
+    "421": "sk",  # Slovakia
+    "386": "si",  # Slovenia
+    "352": "lu",  # Luxembourg
+    "61": "au",   # Australia
+    "81": "jp",   # Japan
+    "86": "cn",   # China
+    "91": "in",   # India
+    "55": "br",   # Brazil
+    "52": "mx",   # Mexico
+}
+
+
+@lru_cache(maxsize=256)
 def _country_to_code(country: str) -> str:
     """Convert country name to ISO 2-letter code (lowercase for Europass compatibility)."""
     if not country:
         return ""
     
-    country_lower = country.lower().strip()
+    country_lower = country.strip().lower()
     
     # Already a 2-letter code - return lowercase
-    if len(country_lower) == 2:
-        return country_lower
-    
-    mapping = {
-        # Full names - all lowercase ISO codes for Europass
-        "france": "fr",
-        "united states": "us",
-        "united states of america": "us",
-        "usa": "us",
-        "united kingdom": "gb",
-        "uk": "gb",
-        "great britain": "gb",
-        "germany": "de",
-        "deutschland": "de",
-        "spain": "es",
-        "españa": "es",
-        "italy": "it",
-        "italia": "it",
-        "belgium": "be",
-        "belgique": "be",
-        "netherlands": "nl",
-        "pays-bas": "nl",
-        "switzerland": "ch",
-        "suisse": "ch",
-        "portugal": "pt",
-        "austria": "at",
-        "poland": "pl",
-        "ireland": "ie",
-        "sweden": "se",
-        "norway": "no",
-        "denmark": "dk",
-        "finland": "fi",
-        "greece": "gr",
-        "czech republic": "cz",
-        "czechia": "cz",
-        "hungary": "hu",
-        "romania": "ro",
-        "bulgaria": "bg",
-        "croatia": "hr",
-        "slovakia": "sk",
-        "slovenia": "si",
-        "luxembourg": "lu",
-        "canada": "ca",
-        "australia": "au",
-        "japan": "jp",
-        "china": "cn",
-        "india": "in",
-        "brazil": "br",
-        "mexico": "mx",
-    }
+    if len(country_lower) == 2 and country_lower in _ISO2_CODES:
+        return sys.intern(country_lower)
     
-    return mapping.get(country_lower, "")
+    return _COUNTRY_NAME_TO_ISO.get(country_lower, "")
 
 
 def _phone_country_to_iso(country_dialing: str) -> str:
     """Convert phone country dialing code to ISO 2-letter country code (lowercase)."""
-    mapping = {
-        "1": "us",    # US/Canada - default to US
-        "33": "fr",   # France
-        "44": "gb",   # UK
-        "49": "de",   # Germany
-        "34": "es",   # Spain
-        "39": "it",   # Italy
-        "32": "be",   # Belgium
-        "31": "nl",   # Netherlands
-        "41": "ch",   # Switzerland
-        "351": "pt",  # Portugal
-        "43": "at",   # Austria
-        "48": "pl",   # Poland
-        "353": "ie",  # Ireland
-        "46": "se",   # Sweden
-        "47": "no",   # Norway
-        "45": "dk",   # Denmark
-        "358": "fi",  # Finland
-        "30": "gr",   # Greece
-        "420": "cz",  # Czech Republic
-        "36": "hu",   # Hungary
-        "40": "ro",   # Romania
-        "359": "bg",  # Bulgaria
-        "385": "hr",  # Croatia
-        "421": "sk",  # Slovakia
-        "386": "si",  # Slovenia
-        "352": "lu",  # Luxembourg
-        "61": "au",   # Australia
-        "81": "jp",   # Japan
-        "86": "cn",   # China
-        "91": "in",   # India
-        "55": "br",   # Brazil
-        "52": "mx",   # Mexico
-    }
-    return mapping.get(str(country_dialing), "")
+    return _PHONE_CODE_TO_ISO.get(str(country_dialing), "")
+
+
+# ISO 639-2/B codes (bibliographic, used by Europass) with their accepted aliases
+_LANG_ALIASES = (
+    ("fre", ("french", "français", "francais", "fre", "fra", "fr")),
+    ("eng", ("english", "anglais", "eng", "en")),
+    ("ger", ("german", "deutsch", "allemand", "ger", "deu", "de")),
+    ("spa", ("spanish", "español", "espagnol", "spa", "es")),
+    ("ita", ("italian", "italiano", "italien", "ita", "it")),
+    ("por", ("portuguese", "português", "portugais", "por", "pt")),
+    ("dut", ("dutch", "nederlands", "néerlandais", "dut", "nld", "nl")),
+    ("chi", ("chinese", "中文", "chinois", "chi", "zho", "zh")),
+    ("jpn", ("japanese", "日本語", "japonais", "jpn", "ja")),
+    ("rus", ("russian", "русский", "russe", "rus", "ru")),
+    ("ara", ("arabic", "العربية", "arabe", "ara", "ar")),
+)
+
+# Alias (NFC, lowercase) -> ISO 639-2/B code
+_LANG_ALIAS = {
+    unicodedata.normalize("NFC", alias): code
+    for code, aliases in _LANG_ALIASES
+    for alias in aliases
+}
 
 
+@lru_cache(maxsize=256)
 def _language_to_iso639b(lang_name: str) -> str:
     """Convert language name to ISO 639-2/B code (used by Europass)."""
-    # ISO 639-2/B codes (bibliographic, used by Europass)
-    mapping = {
-        # French variations
-        "french": "fre",
-        "français": "fre",
-        "francais": "fre",
-        "fre": "fre",
-        "fra": "fre",
-        "fr": "fre",
-        # English variations
-        "english": "eng",
-        "anglais": "eng",
-        "eng": "eng",
-        "en": "eng",
-        # German variations
-        "german": "ger",
-        "deutsch": "ger",
-        "allemand": "ger",
-        "ger": "ger",
-        "deu": "ger",
-        "de": "ger",
-        # Spanish variations
-        "spanish": "spa",
-        "español": "spa",
-        "espagnol": "spa",
-        "spa": "spa",
-        "es": "spa",
-        # Italian variations
-        "italian": "ita",
-        "italiano": "ita",
-        "italien": "ita",
-        "ita": "ita",
-        "it": "ita",
-        # Portuguese variations
-        "portuguese": "por",
-        "português": "por",
-        "portugais": "por",
-        "por": "por",
-        "pt": "por",
-        # Dutch variations
-        "dutch": "dut",
-        "nederlands": "dut",
-        "néerlandais": "dut",
-        "dut": "dut",
-        "nld": "dut",
-        "nl": "dut",
-        # Chinese variations
-        "chinese": "chi",
-        "中文": "chi",
-        "chinois": "chi",
-        "chi": "chi",
-        "zho": "chi",
-        "zh": "chi",
-        # Japanese variations
-        "japanese": "jpn",
-        "日本語": "jpn",
-        "japonais": "jpn",
-        "jpn": "jpn",
-        "ja": "jpn",
-        # Russian variations
-        "russian": "rus",
-        "русский": "rus",
-        "russe": "rus",
-        "rus": "rus",
-        "ru": "rus",
-        # Arabic variations
-        "arabic": "ara",
-        "العربية": "ara",
-        "arabe": "ara",
-        "ara": "ara",
-        "ar": "ara",
-    }
-    lang_lower = lang_name.lower().strip()
-    return mapping.get(lang_lower, lang_lower[:3] if lang_lower else "")
+    lang_lower = unicodedata.normalize("NFC", lang_name).strip().lower()
+    code = _LANG_ALIAS.get(lang_lower)
+    if code is None:
+        code = sys.intern(lang_lower[:3]) if lang_lower else ""
+    return code
+
 
+# (keyword, CEF level) checked in order; "full professional" must precede "professional"
+_CEF_RULES = (
+    ("native", "C2"),
+    ("full professional", "C2"),
+    ("professional", "C1"),
+    ("limited", "B2"),
+    ("intermediate", "B2"),
+    ("elementary", "A2"),
+    ("basic", "A2"),
+)
 
+
+@lru_cache(maxsize=256)
 def _level_to_cef(level: str) -> str:
-    """Convert MAC language level to CEF level."""
+    """Convert MAC language level to CEF level (B1 when no keyword matches)."""
     level_lower = level.lower()
-    if "native" in level_lower or "full professional" in level_lower:
-        return "C2"
-    elif "professional" in level_lower:
-        return "C1"
-    elif "limited" in level_lower or "intermediate" in level_lower:
-        return "B2"
-    elif "elementary" in level_lower or "basic" in level_lower:
-        return "A2"
-    else:
-        return "B1"
+    return next((cef for keyword, cef in _CEF_RULES if keyword in level_lower), "B1")
 
 
 def _build_html_description(challenges: list[dict]) -> str:
@@ -1809,8 +1833,7 @@ def _build_html_description(challenges: list[dict]) -> str:
         desc = challenge.get("description", "")
         if desc:
             # Strip HTML tags if present (simple cleanup)
-            import re
-            clean_desc = re.sub(r'<[^>]+>', '', desc).strip()
+            clean_desc = _HTML_TAG_RE.sub('', desc).strip()
             if clean_desc:
                 items.append(f"<li>{clean_desc}</li>")
     
@@ -1819,57 +1842,65 @@ def _build_html_description(challenges: list[dict]) -> str:
     return ""
 
 
+@lru_cache(maxsize=4096)
 def _validate_date(date_str: str) -> str:
     """Validate and normalize date to YYYY-MM format. Returns empty string if invalid."""
-    import re
     if not date_str:
         return ""
     
     date_str = date_str.strip()
-    
-    # Already valid YYYY-MM format
-    if re.match(r"^\d{4}-\d{2}$", date_str):
-        return date_str
-    
-    # Handle YYYY-MM-DD format (truncate day)
-    if re.match(r"^\d{4}-\d{2}-\d{2}$", date_str):
-        return date_str[:7]
-    
-    # Handle YYYY/MM format
-    if re.match(r"^\d{4}/\d{2}$", date_str):
-        return date_str.replace("/", "-")
-    
-    # Handle MM/YYYY format
-    match = re.match(r"^(\d{2})/(\d{4})$", date_str)
-    if match:
-        return f"{match.group(2)}-{match.group(1)}"
-    
-    # Return as-is if it looks like a year (YYYY)
-    if re.match(r"^\d{4}$", date_str):
-        return f"{date_str}-01"
+    length = len(date_str)
+    
+    if length == 4:
+        # Year only (YYYY) - append January
+        if date_str.isdecimal():
+            return f"{date_str}-01"
+    elif length == 7:
+        # YYYY-MM (already valid) or YYYY/MM
+        if date_str[4] in "-/" and date_str[:4].isdecimal() and date_str[5:].isdecimal():
+            return f"{date_str[:4]}-{date_str[5:]}"
+        # MM/YYYY
+        if date_str[2] == "/" and date_str[:2].isdecimal() and date_str[3:].isdecimal():
+            return f"{date_str[3:]}-{date_str[:2]}"
+    elif length == 10:
+        # YYYY-MM-DD (truncate day)
+        if (
+            date_str[4] == "-" and date_str[7] == "-"
+            and date_str[:4].isdecimal() and date_str[5:7].isdecimal() and date_str[8:].isdecimal()
+        ):
+            return date_str[:7]
     
     logger.warning(f"Invalid date format: {date_str}")
     return ""
 
 
+# MAC hard-skill level -> Europass proficiency score (unknown levels score 3)
+_SKILL_LEVEL_SCORES = {"expert": "5", "high": "4", "medium": "3", "low": "2", "basic": "1"}
+
+
 def _add_skills_to_xml(xml_parts: list[str], knowledge: dict[str, Any]) -> None:
-    """Add hard skills and soft skills to XML parts list."""
-    # Hard skills (technical skills)
-    hard_skills = knowledge.get("hardSkills", [])
-    for hard in hard_skills:
-        skill = hard.get("skill", {})
-        skill_name = skill.get("name", "")
-        skill_level = hard.get("level", "")
-        if skill_name:
-            xml_parts.extend([
+    """Add hard skills and soft skills to XML parts list (one pass over both)."""
+    append = xml_parts.append
+    extend = xml_parts.extend
+    sections = (
+        ("HARDSKILL", "hard-skill", knowledge.get("hardSkills", [])),
+        ("SOFTSKILL", "soft-skill", knowledge.get("softSkills", [])),
+    )
+    for scheme, taxonomy, skills in sections:
+        for entry in skills:
+            skill_name = entry.get("skill", {}).get("name", "")
+            if not skill_name:
+                continue
+            extend([
                 '            <PersonCompetency>',
-                f'                <CompetencyID schemeName="HARDSKILL">{escape(skill_name)}</CompetencyID>',
-                '                <hr:TaxonomyID>hard-skill</hr:TaxonomyID>',
+                f'                <CompetencyID schemeName="{scheme}">{skill_name.translate(_XML_ESC)}</CompetencyID>',
+                f'                <hr:TaxonomyID>{taxonomy}</hr:TaxonomyID>',
             ])
+            # Only hard skills carry a proficiency level
+            skill_level = entry.get("level", "") if scheme == "HARDSKILL" else ""
             if skill_level:
-                level_map = {"expert": "5", "high": "4", "medium": "3", "low": "2", "basic": "1"}
-                level_score = level_map.get(skill_level.lower(), "3")
-                xml_parts.extend([
+                level_score = _SKILL_LEVEL_SCORES.get(skill_level.lower(), "3")
+                extend([
                     '                <eures:CompetencyDimension>',
                     '                    <hr:CompetencyDimensionTypeCode>Proficiency</hr:CompetencyDimensionTypeCode>',
                     '                    <eures:Score>',
@@ -1877,20 +1908,7 @@ def _add_skills_to_xml(xml_parts: list[str], knowledge: dict[str, Any]) -> None:
                     '                    </eures:Score>',
                     '                </eures:CompetencyDimension>',
                 ])
-            xml_parts.append('            </PersonCompetency>')
-    
-    # Soft skills
-    soft_skills = knowledge.get("softSkills", [])
-    for soft in soft_skills:
-        skill = soft.get("skill", {})
-        skill_name = skill.get("name", "")
-        if skill_name:
-            xml_parts.extend([
-                '            <PersonCompetency>',
-                f'                <CompetencyID schemeName="SOFTSKILL">{escape(skill_name)}</CompetencyID>',
-                '                <hr:TaxonomyID>soft-skill</hr:TaxonomyID>',
-                '            </PersonCompetency>',
-            ])
+            append('            </PersonCompetency>')
 
 
 async def _wait_for_network_idle(page: Page, timeout: int = 10000) -> None:
@@ -2070,8 +2088,8 @@ async def generate_pdf(
             }
         resume_data = _resumes[resume_id]
     elif _resumes:
-        # Use most recent (last inserted)
-        resume_id = list(_resumes.keys())[-1]
+        # Use most recent (last written)
+        resume_id = next(reversed(_resumes))
         resume_data = _resumes[resume_id]
         logger.info(f"Using most recent resume: {resume_id}")
     else:
@@ -2238,16 +2256,10 @@ async def generate_pdf(
         }
 
 
-@mcp.tool
-def get_mac_schema() -> dict[str, Any]:
-    """
-    Get the MAC (Manfred Awesomic CV) JSON Schema for reference.
-    
-    Returns the schema structure to help construct valid MAC JSON.
-    
-    Returns:
-        MAC JSON Schema overview with key sections
-    """
+def _build_mac_schema() -> dict[str, Any]:
+    """Build the static MAC schema overview returned by get_mac_schema."""
+    # A fresh literal per call is cheaper than deep-copying a shared dict, and
+    # callers that mutate their result never alter later ones
     return {
         "schema_url": "https://raw.githubusercontent.com/getmanfred/mac/v0.5/schema/schema.json",
         "version": "0.5",
@@ -2288,6 +2300,19 @@ def get_mac_schema() -> dict[str, Any]:
     }
 
 
+@mcp.tool
+def get_mac_schema() -> dict[str, Any]:
+    """
+    Get the MAC (Manfred Awesomic CV) JSON Schema for reference.
+    
+    Returns the schema structure to help construct valid MAC JSON.
+    
+    Returns:
+        MAC JSON Schema overview with key sections
+    """
+    return _build_mac_schema()
+
+
 def main():
     """Entry point for the europass-mcp CLI command."""
     mcp.run()
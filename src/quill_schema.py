@@ -17,14 +17,21 @@ Usage:
     is_valid = validate_delta({"ops": [{"insert": "World\\n"}]})
 """
 
-from typing import Any, Dict, List, Literal, Optional, Union
+import re
+from functools import cached_property, lru_cache
+from html.parser import HTMLParser
+from typing import Annotated, Any, Dict, List, Literal, Optional, Union
 
 from pydantic import (
     BaseModel,
     ConfigDict,
+    Discriminator,
     Field,
+    StrictStr,
+    Tag,
+    TypeAdapter,
+    ValidationError,
     field_validator,
-    model_validator,
 )
 
 
@@ -98,8 +105,57 @@ class DeltaAttributes(InlineAttributes, BlockAttributes):
     
     Inherits both inline and block-level attributes.
     Quill operations can have any combination of these.
+    
+    Frozen because validated ops share one instance per attribute shape
+    (see _canonical_attrs).
     """
-    pass
+    model_config = ConfigDict(frozen=True)
+
+
+# Attribute value types that may be shared by cache key. The value's type is
+# part of the key since True, 1 and 1.0 hash and compare equal; other types
+# (floats, containers) are validated uncached
+_CACHEABLE_ATTR_TYPES = frozenset({str, int, bool, type(None)})
+
+
+def _attrs_key(attrs: Dict[str, Any]) -> Optional[tuple]:
+    """Return the _canonical_attrs key for an attribute dict, or None if uncacheable."""
+    key = []
+    for name, value in attrs.items():
+        value_type = type(value)
+        if value_type not in _CACHEABLE_ATTR_TYPES:
+            return None
+        key.append((name, value_type, value))
+    return tuple(key)
+
+
+@lru_cache(maxsize=512)
+def _canonical_attrs(key: tuple) -> Optional[DeltaAttributes]:
+    """
+    Validate an attribute shape once and share the result across ops.
+    
+    Validation is strict, so only shapes that strict and lax callers both
+    accept unchanged are shared. Returns None for any other shape (invalid,
+    or needing coercion such as ``bold: 1``); callers then validate as usual.
+    """
+    try:
+        return DeltaAttributes.model_validate(
+            {name: value for name, _, value in key}, strict=True
+        )
+    except ValidationError:
+        return None
+
+
+def _cached_attributes(v: Any, handler: Any) -> Optional[DeltaAttributes]:
+    """Wrap validator for op ``attributes``: reuse canonical instances."""
+    if type(v) is dict:
+        key = _attrs_key(v)
+        if key is not None:
+            attrs = _canonical_attrs(key)
+            if attrs is not None:
+                return attrs
+    # Let the regular validator coerce or report errors in the caller's mode
+    return handler(v)
 
 
 # =============================================================================
@@ -150,25 +206,18 @@ class DeltaInsertOp(BaseModel):
     
     The most common operation type - inserts text or embeds.
     """
-    insert: Union[str, Dict[str, Any]]  # String or embed dict (image, video, etc.)
+    model_config = ConfigDict(frozen=True)
+    
+    # String or non-empty embed dict (image, video, etc.; unknown embeds allowed
+    # for extensibility). Declared with native constraints so pydantic-core
+    # checks it without a Python validator call per op.
+    insert: Union[StrictStr, Annotated[Dict[str, Any], Field(min_length=1)]]
     attributes: Optional[DeltaAttributes] = None
     
-    @field_validator("insert", mode="before")
+    @field_validator("attributes", mode="wrap")
     @classmethod
-    def validate_insert(cls, v: Any) -> Union[str, Dict[str, Any]]:
-        if isinstance(v, str):
-            return v
-        if isinstance(v, dict):
-            # Should have exactly one key for embed type
-            if len(v) == 0:
-                raise ValueError("Embed object cannot be empty")
-            # Validate known embed types
-            valid_embed_keys = {"image", "video", "formula", "divider"}
-            if v.keys() & valid_embed_keys:
-                return v  # Return as dict, don't convert to model
-            # Allow unknown embeds (extensibility)
-            return v
-        raise ValueError(f"Insert must be string or embed dict, got {type(v)}")
+    def share_attributes(cls, v: Any, handler: Any) -> Optional[DeltaAttributes]:
+        return _cached_attributes(v, handler)
 
 
 class DeltaRetainOp(BaseModel):
@@ -178,8 +227,15 @@ class DeltaRetainOp(BaseModel):
     Used in diff/change deltas to skip over content.
     Optionally applies attributes to the retained range.
     """
+    model_config = ConfigDict(frozen=True)
+    
     retain: int = Field(..., ge=1)
     attributes: Optional[DeltaAttributes] = None
+    
+    @field_validator("attributes", mode="wrap")
+    @classmethod
+    def share_attributes(cls, v: Any, handler: Any) -> Optional[DeltaAttributes]:
+        return _cached_attributes(v, handler)
 
 
 class DeltaDeleteOp(BaseModel):
@@ -188,11 +244,34 @@ class DeltaDeleteOp(BaseModel):
     
     Used in diff/change deltas to remove content.
     """
+    model_config = ConfigDict(frozen=True)
+    
     delete: int = Field(..., ge=1)
 
 
-# Union of all operation types
-DeltaOp = Union[DeltaInsertOp, DeltaRetainOp, DeltaDeleteOp]
+def _op_kind(v: Any) -> Optional[str]:
+    """Return the union tag of a raw or already-built Delta op."""
+    if isinstance(v, dict):
+        return "insert" if "insert" in v else "retain" if "retain" in v else "delete" if "delete" in v else None
+    if isinstance(v, DeltaInsertOp):
+        return "insert"
+    if isinstance(v, DeltaRetainOp):
+        return "retain"
+    if isinstance(v, DeltaDeleteOp):
+        return "delete"
+    return None
+
+
+# Union of all operation types, tagged by which op key is present so
+# pydantic-core dispatches straight to one variant instead of trying each
+DeltaOp = Annotated[
+    Union[
+        Annotated[DeltaInsertOp, Tag("insert")],
+        Annotated[DeltaRetainOp, Tag("retain")],
+        Annotated[DeltaDeleteOp, Tag("delete")],
+    ],
+    Discriminator(_op_kind),
+]
 
 
 # =============================================================================
@@ -218,33 +297,30 @@ class QuillDelta(BaseModel):
             ]
         }
     """
+    # Frozen so derived values such as plain_text can be cached. The ops list
+    # is read-only by convention: build a new delta or use model_copy rather
+    # than mutating it in place
+    model_config = ConfigDict(frozen=True)
+    
     ops: List[DeltaOp] = Field(..., min_length=1)
     
-    @model_validator(mode="after")
-    def validate_document_ends_with_newline(self) -> "QuillDelta":
-        """
-        Validate that document deltas end with a newline.
-        
-        For document deltas (not change deltas), the last insert
-        should typically be a newline. This is a soft validation
-        that logs a warning rather than raising an error.
-        """
-        if self.ops:
-            last_op = self.ops[-1]
-            if hasattr(last_op, "insert"):
-                insert_val = last_op.insert
-                if isinstance(insert_val, str) and not insert_val.endswith("\n"):
-                    # This is common and not necessarily wrong
-                    pass
-        return self
+    @cached_property
+    def plain_text(self) -> str:
+        """Plain text of all string inserts, computed once per delta."""
+        return "".join(
+            op.insert for op in self.ops
+            if isinstance(op, DeltaInsertOp) and isinstance(op.insert, str)
+        )
+    
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> "QuillDelta":
+        """Copy the delta, dropping cached values that ``update`` may invalidate."""
+        copied = super().model_copy(update=update, deep=deep)
+        copied.__dict__.pop("plain_text", None)
+        return copied
     
     def to_plain_text(self) -> str:
         """Extract plain text from the delta."""
-        text_parts = []
-        for op in self.ops:
-            if hasattr(op, "insert") and isinstance(op.insert, str):
-                text_parts.append(op.insert)
-        return "".join(text_parts)
+        return self.plain_text
     
     def get_insert_ops(self) -> List[DeltaInsertOp]:
         """Get only insert operations."""
@@ -252,32 +328,41 @@ class QuillDelta(BaseModel):
     
     def count_formatted_text(self) -> Dict[str, int]:
         """Count characters with specific formatting."""
-        counts = {
-            "bold": 0,
-            "italic": 0,
-            "underline": 0,
-            "link": 0,
-            "header": 0,
-            "list": 0,
-        }
+        # Single pass with local accumulators; the result dict is built once
+        bold = italic = underline = link = header = list_ = 0
         for op in self.ops:
-            if hasattr(op, "insert") and isinstance(op.insert, str) and hasattr(op, "attributes"):
-                attrs = op.attributes
-                if attrs:
-                    length = len(op.insert)
-                    if attrs.bold:
-                        counts["bold"] += length
-                    if attrs.italic:
-                        counts["italic"] += length
-                    if attrs.underline:
-                        counts["underline"] += length
-                    if attrs.link:
-                        counts["link"] += length
-                    if attrs.header:
-                        counts["header"] += length
-                    if attrs.list:
-                        counts["list"] += length
-        return counts
+            # Only text inserts count; retain/delete ops carry no text
+            if not isinstance(op, DeltaInsertOp):
+                continue
+            attrs = op.attributes
+            insert = op.insert
+            if attrs is None or not isinstance(insert, str):
+                continue
+            length = len(insert)
+            if attrs.bold:
+                bold += length
+            if attrs.italic:
+                italic += length
+            if attrs.underline:
+                underline += length
+            if attrs.link:
+                link += length
+            if attrs.header:
+                header += length
+            if attrs.list:
+                list_ += length
+        return {
+            "bold": bold,
+            "italic": italic,
+            "underline": underline,
+            "link": link,
+            "header": header,
+            "list": list_,
+        }
+
+
+# Prebuilt adapter shared by the validation helpers
+QUILL_DELTA_ADAPTER: TypeAdapter[QuillDelta] = TypeAdapter(QuillDelta)
 
 
 # =============================================================================
@@ -295,9 +380,9 @@ def validate_delta(data: Dict[str, Any]) -> bool:
         True if valid, False otherwise
     """
     try:
-        QuillDelta.model_validate(data)
+        QUILL_DELTA_ADAPTER.validate_python(data)
         return True
-    except Exception:
+    except ValidationError:
         return False
 
 
@@ -314,7 +399,7 @@ def validate_delta_strict(data: Dict[str, Any]) -> QuillDelta:
     Raises:
         ValidationError: If data is invalid
     """
-    return QuillDelta.model_validate(data)
+    return QUILL_DELTA_ADAPTER.validate_python(data)
 
 
 def create_simple_delta(text: str, attributes: Optional[Dict[str, Any]] = None) -> QuillDelta:
@@ -331,19 +416,30 @@ def create_simple_delta(text: str, attributes: Optional[Dict[str, Any]] = None)
     if not text.endswith("\n"):
         text += "\n"
     
-    ops = []
     if attributes:
-        ops.append(DeltaInsertOp(insert=text, attributes=DeltaAttributes(**attributes)))
+        key = _attrs_key(attributes)
+        attrs = _canonical_attrs(key) if key is not None else None
+        if attrs is None:
+            # Uncacheable, coerced or invalid values: validate uncached
+            attrs = DeltaAttributes(**attributes)
+        op = DeltaInsertOp(insert=text, attributes=attrs)
     else:
-        ops.append(DeltaInsertOp(insert=text))
+        op = DeltaInsertOp(insert=text)
     
-    return QuillDelta(ops=ops)
+    return QuillDelta(ops=[op])
 
 
 # =============================================================================
 # Europass-specific Quill Patterns
 # =============================================================================
 
+# Bullet newline attributes indexed by indent level (0-8); ops get copies
+_BULLET_ATTRS_BY_INDENT = tuple(
+    {"list": "bullet", "indent": level} if level else {"list": "bullet"}
+    for level in range(9)
+)
+
+
 class EuropassListItem(BaseModel):
     """
     A single list item in Europass Quill format.
@@ -353,33 +449,21 @@ class EuropassListItem(BaseModel):
     - data-list="bullet" for bullet points
     - ql-indent-N classes for nesting
     """
+    model_config = ConfigDict(frozen=True)
+    
     content: str
     indent_level: int = Field(default=0, ge=0, le=8)
     is_bold: bool = False
     
     def to_delta_ops(self) -> List[Dict[str, Any]]:
         """Convert to Delta operations."""
-        ops = []
+        # Newline with list formatting, copied from the per-indent template
+        newline_op = {"insert": "\n", "attributes": _BULLET_ATTRS_BY_INDENT[self.indent_level].copy()}
         
         # Add content with optional bold
         if self.is_bold:
-            ops.append({
-                "insert": self.content,
-                "attributes": {"bold": True}
-            })
-        else:
-            ops.append({"insert": self.content})
-        
-        # Add newline with list formatting
-        attrs = {"list": "bullet"}
-        if self.indent_level > 0:
-            attrs["indent"] = self.indent_level
-        ops.append({
-            "insert": "\n",
-            "attributes": attrs
-        })
-        
-        return ops
+            return [{"insert": self.content, "attributes": {"bold": True}}, newline_op]
+        return [{"insert": self.content}, newline_op]
 
 
 class EuropassSection(BaseModel):
@@ -394,29 +478,133 @@ class EuropassSection(BaseModel):
     items: List[EuropassListItem] = Field(default_factory=list)
     
     def to_delta(self) -> QuillDelta:
-        """Convert section to QuillDelta."""
-        ops = []
+        """
+        Convert section to QuillDelta.
+        
+        Ops are built in a single loop as op models (attributes come from
+        the shared canonical cache) and the delta is assembled with
+        model_construct, since the items are already validated.
+        """
+        ops: List[DeltaOp] = []
+        append = ops.append
         
         # Add header if present
         if self.header:
-            ops.append({"insert": self.header})
-            ops.append({"insert": "\n", "attributes": {"header": 2}})
+            append(DeltaInsertOp(insert=self.header))
+            append(DeltaInsertOp(insert="\n", attributes=_canonical_attrs((("header", int, 2),))))
         
         # Add list items
         for item in self.items:
-            ops.extend(item.to_delta_ops())
+            if item.is_bold:
+                append(DeltaInsertOp(insert=item.content, attributes=_canonical_attrs((("bold", bool, True),))))
+            else:
+                append(DeltaInsertOp(insert=item.content))
+            if item.indent_level > 0:
+                attrs = _canonical_attrs((("list", str, "bullet"), ("indent", int, item.indent_level)))
+            else:
+                attrs = _canonical_attrs((("list", str, "bullet"),))
+            append(DeltaInsertOp(insert="\n", attributes=attrs))
         
         # Ensure we have at least one op
         if not ops:
-            ops.append({"insert": "\n"})
+            append(DeltaInsertOp(insert="\n"))
         
-        return QuillDelta.model_validate({"ops": ops})
+        return QuillDelta.model_construct(ops=ops)
 
 
 # =============================================================================
 # HTML to Delta Conversion Helpers
 # =============================================================================
 
+_HEADING_TAGS = frozenset({"h1", "h2", "h3", "h4", "h5", "h6"})
+_QL_INDENT_RE = re.compile(r"ql-indent-(\d+)")
+
+# Inputs longer than this bypass the memo cache (avoid pinning huge strings)
+_CACHE_MAX_CHARS = 64 * 1024
+
+
+class _DeltaBuilder(HTMLParser):
+    """Accumulates Delta ops from html.parser start/end/text events."""
+
+    def __init__(self):
+        super().__init__()
+        self.ops = []
+        self.current_text = ""
+        self.current_attrs = {}
+        self.list_indent = 0
+
+    def flush_text(self):
+        if self.current_text:
+            op = {"insert": self.current_text}
+            if self.current_attrs:
+                op["attributes"] = self.current_attrs.copy()
+            self.ops.append(op)
+            self.current_text = ""
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "strong" or tag == "b":
+            self.flush_text()
+            self.current_attrs["bold"] = True
+        elif tag == "em" or tag == "i":
+            self.flush_text()
+            self.current_attrs["italic"] = True
+        elif tag == "u":
+            self.flush_text()
+            self.current_attrs["underline"] = True
+        elif tag == "a":
+            self.flush_text()
+            self.current_attrs["link"] = dict(attrs).get("href", "")
+        elif tag == "li":
+            # Check for ql-indent-N class
+            class_str = dict(attrs).get("class") or ""
+            match = _QL_INDENT_RE.search(class_str)
+            self.list_indent = int(match.group(1)) if match else 0
+        elif tag in _HEADING_TAGS:
+            self.flush_text()
+            level = int(tag[1])
+            self.current_attrs["header"] = level
+
+    def handle_endtag(self, tag):
+        if tag in ("strong", "b"):
+            self.flush_text()
+            self.current_attrs.pop("bold", None)
+        elif tag in ("em", "i"):
+            self.flush_text()
+            self.current_attrs.pop("italic", None)
+        elif tag == "u":
+            self.flush_text()
+            self.current_attrs.pop("underline", None)
+        elif tag == "a":
+            self.flush_text()
+            self.current_attrs.pop("link", None)
+        elif tag == "li":
+            self.flush_text()
+            # Add newline with list attributes
+            attrs = {"list": "bullet"}
+            if self.list_indent > 0:
+                attrs["indent"] = self.list_indent
+            self.ops.append({"insert": "\n", "attributes": attrs})
+        elif tag in _HEADING_TAGS:
+            self.flush_text()
+            level = int(tag[1])
+            self.ops.append({"insert": "\n", "attributes": {"header": level}})
+            self.current_attrs.pop("header", None)
+        elif tag == "p":
+            self.flush_text()
+            self.ops.append({"insert": "\n"})
+
+    def handle_data(self, data):
+        # Skip whitespace-only data between tags
+        if data.strip() or self.current_text:
+            self.current_text += data
+
+    def get_ops(self) -> List[Dict[str, Any]]:
+        self.flush_text()
+        if not self.ops:
+            self.ops.append({"insert": "\n"})
+        return self.ops
+
+
 def html_to_delta_ops(html: str) -> List[Dict[str, Any]]:
     """
     Convert simple Quill HTML to Delta operations.
@@ -424,108 +612,44 @@ def html_to_delta_ops(html: str) -> List[Dict[str, Any]]:
     This is a basic converter for common patterns.
     For full conversion, use quill-delta library.
     
+    Tags are handled as the stdlib tokenizer reports them, with no HTML5
+    tree construction, so output never depends on optional packages.
+    Results are memoized per input (the same CV fragments recur across
+    retries); callers get fresh op dicts, so mutating them never touches
+    the cache. Use html_to_delta_ops.cache_clear() to reset the cache.
+    
     Args:
         html: Quill-formatted HTML string
         
     Returns:
         List of Delta operation dictionaries
     """
-    import re
-    from html.parser import HTMLParser
-    
-    class DeltaBuilder(HTMLParser):
-        def __init__(self):
-            super().__init__()
-            self.ops = []
-            self.current_text = ""
-            self.current_attrs = {}
-            self.list_indent = 0
-            
-        def flush_text(self):
-            if self.current_text:
-                op = {"insert": self.current_text}
-                if self.current_attrs:
-                    op["attributes"] = self.current_attrs.copy()
-                self.ops.append(op)
-                self.current_text = ""
-        
-        def handle_starttag(self, tag, attrs):
-            attrs_dict = dict(attrs)
-            
-            if tag == "strong" or tag == "b":
-                self.flush_text()
-                self.current_attrs["bold"] = True
-            elif tag == "em" or tag == "i":
-                self.flush_text()
-                self.current_attrs["italic"] = True
-            elif tag == "u":
-                self.flush_text()
-                self.current_attrs["underline"] = True
-            elif tag == "a":
-                self.flush_text()
-                self.current_attrs["link"] = attrs_dict.get("href", "")
-            elif tag == "li":
-                # Check for ql-indent-N class
-                class_str = attrs_dict.get("class", "")
-                match = re.search(r"ql-indent-(\d+)", class_str)
-                if match:
-                    self.list_indent = int(match.group(1))
-                else:
-                    self.list_indent = 0
-            elif tag in ("h1", "h2", "h3", "h4", "h5", "h6"):
-                self.flush_text()
-                level = int(tag[1])
-                self.current_attrs["header"] = level
-        
-        def handle_endtag(self, tag):
-            if tag in ("strong", "b"):
-                self.flush_text()
-                self.current_attrs.pop("bold", None)
-            elif tag in ("em", "i"):
-                self.flush_text()
-                self.current_attrs.pop("italic", None)
-            elif tag == "u":
-                self.flush_text()
-                self.current_attrs.pop("underline", None)
-            elif tag == "a":
-                self.flush_text()
-                self.current_attrs.pop("link", None)
-            elif tag == "li":
-                self.flush_text()
-                # Add newline with list attributes
-                attrs = {"list": "bullet"}
-                if self.list_indent > 0:
-                    attrs["indent"] = self.list_indent
-                self.ops.append({"insert": "\n", "attributes": attrs})
-            elif tag in ("h1", "h2", "h3", "h4", "h5", "h6"):
-                self.flush_text()
-                level = int(tag[1])
-                self.ops.append({"insert": "\n", "attributes": {"header": level}})
-                self.current_attrs.pop("header", None)
-            elif tag == "p":
-                self.flush_text()
-                self.ops.append({"insert": "\n"})
-        
-        def handle_data(self, data):
-            # Skip whitespace-only data between tags
-            if data.strip() or self.current_text:
-                self.current_text += data
-        
-        def get_ops(self) -> List[Dict[str, Any]]:
-            self.flush_text()
-            if not self.ops:
-                self.ops.append({"insert": "\n"})
-            return self.ops
-    
-    parser = DeltaBuilder()
-    parser.feed(html)
-    return parser.get_ops()
+    if len(html) > _CACHE_MAX_CHARS:
+        return _html_to_delta_ops(html)
+    return [
+        {**op, "attributes": op["attributes"].copy()} if "attributes" in op else op.copy()
+        for op in _html_to_delta_ops_cached(html)
+    ]
+
+
+def _html_to_delta_ops(html: str) -> List[Dict[str, Any]]:
+    """Uncached HTML → Delta conversion (see html_to_delta_ops)."""
+    builder = _DeltaBuilder()
+    builder.feed(html)
+    return builder.get_ops()
+
+
+# Cached ops are only ever handed out as copies (see html_to_delta_ops)
+_html_to_delta_ops_cached = lru_cache(maxsize=256)(_html_to_delta_ops)
+html_to_delta_ops.cache_clear = _html_to_delta_ops_cached.cache_clear
+html_to_delta_ops.cache_info = _html_to_delta_ops_cached.cache_info
 
 
 # Export public API
 __all__ = [
     # Main types
     "QuillDelta",
+    "QUILL_DELTA_ADAPTER",
     "DeltaOp",
     "DeltaInsertOp",
     "DeltaRetainOp",
@@ -0,0 +1,7 @@
+"""Shared pytest configuration: make src/ importable for flat module imports."""
+
+import sys
+from pathlib import Path
+
+_SRC = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(_SRC))
@@ -6,10 +6,10 @@ Quill Editor HTML format with proper nesting via ql-indent-N classes.
 """
 
 import re
-from collections import Counter
 
 import pytest
 
+from src.html_transform import quill_metrics
 from src.mcp_server import _markdown_to_html
 
 
@@ -86,6 +86,8 @@ class TestNestedLists:
 
     def test_europass_style_structure(self):
         """Test structure matching Europass CV format."""
+        from collections import Counter
+
         md = """- **Contexte :** Description du contexte.
 
 - **Réalisations :**
@@ -186,21 +188,17 @@ class TestQuillFormatCompliance:
         """All li elements should have data-list='bullet'."""
         md = """- Item 1
   - Nested"""
-        html = _markdown_to_html(md)
+        metrics = quill_metrics(_markdown_to_html(md))
         
-        li_count = html.count("<li")
-        data_list_count = html.count('data-list="bullet"')
-        assert li_count == data_list_count
+        assert metrics["<li"] == metrics['data-list="bullet"']
 
     def test_ql_ui_span(self):
         """All li elements should have <span class='ql-ui'></span>."""
         md = """- Item 1
 - Item 2"""
-        html = _markdown_to_html(md)
+        metrics = quill_metrics(_markdown_to_html(md))
         
-        li_count = html.count("<li")
-        ql_ui_count = html.count('<span class="ql-ui"></span>')
-        assert li_count == ql_ui_count
+        assert metrics["<li"] == metrics["ql-ui"]
 
 
 def compare_with_original(original_xml_path: str, generated_xml_path: str) -> dict:
@@ -209,7 +207,6 @@ def compare_with_original(original_xml_path: str, generated_xml_path: str) -> di
     
     Returns dict with comparison metrics for validation.
     """
-    import re
     from pathlib import Path
     
     def extract_metrics(xml_content: str) -> dict:
@@ -8,14 +8,17 @@ Tests the AST-based markdown transformer that converts:
 This is deterministic transformation, so we can test exhaustively.
 """
 
+import re
+
 import pytest
-import sys
-from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from markdown_transform import markdown_to_quill_html_fused, transform_headings_to_bullets
 
-from markdown_transform import transform_headings_to_bullets
+_ACHIEVEMENTS_RE = re.compile(r"^- \*\*Achievements\*\*$", re.M)
+_MAIN_RE = re.compile(r"^  - Main achievement", re.M)
+_SUB_RE = re.compile(r"^    - Sub-achievement", re.M)
+# (indent, first 20 chars from the marker) for every bullet line
+_BULLET_LINE_RE = re.compile(r"^( *)(-.{0,19})", re.M)
 
 
 class TestBasicTransformation:
@@ -83,12 +86,11 @@ class TestNestedLists:
 - Another main
 """
         result = transform_headings_to_bullets(input_md)
-        lines = result.strip().split('\n')
         
         # Check structure preserved (2-space indent per level)
-        assert any("- **Achievements**" in line for line in lines)
-        assert any("  - Main achievement" in line for line in lines)
-        assert any("    - Sub-achievement" in line for line in lines)
+        assert _ACHIEVEMENTS_RE.search(result)
+        assert _MAIN_RE.search(result)
+        assert _SUB_RE.search(result)
 
     def test_mixed_markers(self):
         """Different list markers (*, -, +) should all work."""
@@ -104,9 +106,11 @@ class TestNestedLists:
         # All items should be nested under heading
         assert "- **Tasks**" in result
         # Items should be indented (2 spaces)
-        lines = [l for l in result.split('\n') if l.strip().startswith('-')]
-        indented = [l for l in lines if l.startswith('  ') and not l.startswith('- **')]
-        assert len(indented) >= 3  # All 3 tasks should be indented
+        indented = sum(
+            1 for l in result.splitlines()
+            if l.startswith('  ') and l.lstrip().startswith('-')
+        )
+        assert indented >= 3  # All 3 tasks should be indented
 
 
 class TestEdgeCases:
@@ -210,9 +214,11 @@ class TestRealWorldPatterns:
         assert "  - **Agent IA" in result or "  - **Pipeline RAG" in result
         
         # Deep nesting should work (4-space = level 2)
-        lines = result.split('\n')
-        deep_nested = [l for l in lines if l.startswith('    -') and not l.startswith('    - **Backend') and not l.startswith('    - **Frontend')]
-        assert len(deep_nested) >= 2  # Backend/Frontend sub-items
+        deep_nested = sum(
+            1 for l in result.splitlines()
+            if l.startswith('    -') and not l.startswith(('    - **Backend', '    - **Frontend'))
+        )
+        assert deep_nested >= 2  # Backend/Frontend sub-items
 
     def test_context_paragraph_preserved(self):
         """Context paragraphs before lists should be preserved."""
@@ -239,15 +245,11 @@ class TestIndentLevels:
         - Level 3 item
 """
         result = transform_headings_to_bullets(input_md)
-        lines = result.strip().split('\n')
         
         # Find indent levels
         indents = {}
-        for line in lines:
-            if line.strip().startswith('-'):
-                indent = len(line) - len(line.lstrip())
-                content = line.strip()[:20]
-                indents[content] = indent
+        for m in _BULLET_LINE_RE.finditer(result):
+            indents.setdefault(m.group(2), len(m.group(1)))
         
         # Heading at L0 (0 spaces)
         # Items shift +4 spaces from their original position
@@ -275,6 +277,115 @@ class TestIdempotency:
         assert result1 == result2
 
 
+class TestCaching:
+    """Test memoization of the transform."""
+
+    def test_repeated_input_hits_cache(self):
+        """Same markdown is only transformed once."""
+        transform_headings_to_bullets.cache_clear()
+        input_md = "## Tasks\n- Task 1\n"
+        result1 = transform_headings_to_bullets(input_md)
+        result2 = transform_headings_to_bullets(input_md)
+        assert result1 == result2
+        assert transform_headings_to_bullets.cache_info().hits == 1
+
+    def test_large_input_bypasses_cache(self):
+        """Inputs above the size guard are not cached."""
+        transform_headings_to_bullets.cache_clear()
+        input_md = "## Tasks\n" + "- Task\n" * 20000
+        result = transform_headings_to_bullets(input_md)
+        assert result.startswith("- **Tasks**")
+        assert transform_headings_to_bullets.cache_info().currsize == 0
+
+
+class TestFusedQuillRendering:
+    """Test the single-pass markdown → Quill HTML renderer."""
+
+    def test_heading_becomes_bold_bullet_with_indented_children(self):
+        """Heading + list renders as bold level-0 bullet and ql-indent-1 items."""
+        input_md = """\
+## Achievements
+- Built API
+    - With FastAPI
+"""
+        result = markdown_to_quill_html_fused(input_md)
+        assert result == (
+            '<ol><li data-list="bullet"><span class="ql-ui"></span>'
+            '<strong>Achievements</strong></li>'
+            '<li data-list="bullet" class="ql-indent-1"><span class="ql-ui"></span>Built API</li>'
+            '<li data-list="bullet" class="ql-indent-2"><span class="ql-ui"></span>With FastAPI</li>'
+            '</ol>'
+        )
+
+    def test_matches_two_pass_structure(self):
+        """Fused output has one <li> per bullet of the two-pass transform."""
+        input_md = """\
+**Contexte :** Intro.
+
+## Réalisations :
+- Agent IA
+- Pipeline RAG
+
+## Tâches :
+- **Backend :**
+    - Codage
+"""
+        transformed = transform_headings_to_bullets(input_md)
+        bullets = sum(1 for line in transformed.splitlines() if line.lstrip().startswith("- "))
+        result = markdown_to_quill_html_fused(input_md)
+        assert result.count("<li") == bullets
+        assert "<p><strong>Contexte :</strong> Intro.</p>" in result
+        assert "\n" not in result
+
+    def test_headings_as_bullets_disabled(self):
+        """With headings_as_bullets=False headings keep their <hN> tag."""
+        result = markdown_to_quill_html_fused("## Tasks\n- Task 1", headings_as_bullets=False)
+        assert result.startswith("<h2>Tasks</h2><ol>")
+        assert "ql-indent" not in result
+
+    def test_external_links_secured(self):
+        """External links get target/rel, mailto links do not."""
+        result = markdown_to_quill_html_fused(
+            "- [Site](https://example.com)\n- [Mail](mailto:a@example.com)"
+        )
+        assert result.count('target="_blank"') == 1
+        assert 'rel="noopener noreferrer"' in result
+
+    def test_raw_html_escaped(self):
+        """Inline and block HTML is escaped, never copied into the output."""
+        result = markdown_to_quill_html_fused("- <img src=x onerror=alert(1)> hi")
+        assert "<img" not in result
+        assert "&lt;img src=x onerror=alert(1)&gt; hi" in result
+        assert markdown_to_quill_html_fused("<script>alert(1)</script>") == (
+            "<p>&lt;script&gt;alert(1)&lt;/script&gt;</p>"
+        )
+
+    def test_ordered_list_rendered(self):
+        """Ordered lists become data-list="ordered" items, nesting kept."""
+        result = markdown_to_quill_html_fused("1. One\n2. Two\n   - Detail")
+        assert result == (
+            '<ol><li data-list="ordered"><span class="ql-ui"></span>One</li>'
+            '<li data-list="ordered"><span class="ql-ui"></span>Two</li>'
+            '<li data-list="bullet" class="ql-indent-1"><span class="ql-ui"></span>Detail</li>'
+            '</ol>'
+        )
+
+    def test_ordered_list_under_heading(self):
+        """An ordered list after a heading is indented under its bold bullet."""
+        result = markdown_to_quill_html_fused("## Steps\n1. First\n   1. Sub")
+        assert result == (
+            '<ol><li data-list="bullet"><span class="ql-ui"></span><strong>Steps</strong></li>'
+            '<li data-list="ordered" class="ql-indent-1"><span class="ql-ui"></span>First</li>'
+            '<li data-list="ordered" class="ql-indent-2"><span class="ql-ui"></span>Sub</li>'
+            '</ol>'
+        )
+
+    def test_empty_input(self):
+        """Empty input renders to empty string."""
+        assert markdown_to_quill_html_fused("") == ""
+        assert markdown_to_quill_html_fused("   ") == ""
+
+
 class TestWhitespace:
     """Test whitespace handling."""
 
@@ -1,8 +1,12 @@
 """Tests for the Europass MCP Server."""
 
+import copy
 import json
+import re
 import pytest
 from pathlib import Path
+from types import MappingProxyType
+from xml.etree import ElementTree as ET
 
 # Import the module to test
 from src.mcp_server import (
@@ -25,10 +29,14 @@ from src.mcp_server import (
 # Fixtures
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_mac_json():
-    """Return a minimal valid MAC JSON structure."""
-    return {
+    """
+    Return a minimal valid MAC JSON structure (shared, read-only).
+    
+    Built once per session; tests that mutate it must use mutable_mac_json.
+    """
+    return MappingProxyType({
         "settings": {"language": "EN"},
         "aboutMe": {
             "profile": {
@@ -98,12 +106,64 @@ def sample_mac_json():
                 }
             ]
         }
-    }
+    })
+
 
+@pytest.fixture(scope="session")
+def sample_xml(sample_mac_json):
+    """Return the Europass XML for sample_mac_json, generated once per session."""
+    return _mac_to_europass_xml(sample_mac_json)
 
-@pytest.fixture(autouse=True)
+
+@pytest.fixture
+def mutable_mac_json(sample_mac_json):
+    """Return a private deep copy of sample_mac_json for tests that mutate it."""
+    return copy.deepcopy(dict(sample_mac_json))
+
+
+# Minimal MAC shared by the XML variant tests; tests copy before mutating.
+_BASE_PROFILE_MAC = {
+    "settings": {"language": "EN"},
+    "aboutMe": {
+        "profile": {"name": "Jane", "surnames": "Smith"}
+    },
+}
+
+_BASE_DESC_MAC = {
+    **_BASE_PROFILE_MAC,
+    "experience": {
+        "jobs": [{
+            "organization": {"name": "Acme Inc"},
+            "roles": [{
+                "name": "Engineer",
+                "startDate": "2022-01",
+                "challenges": [{"description": "Short bullet point"}],
+            }]
+        }]
+    },
+}
+
+
+_NEEDLE_PATTERNS: dict[tuple[str, ...], re.Pattern] = {}
+
+
+def _assert_contains_all(text, *needles):
+    """Assert every needle occurs in text, scanning it once."""
+    pattern = _NEEDLE_PATTERNS.get(needles)
+    if pattern is None:
+        pattern = _NEEDLE_PATTERNS[needles] = re.compile("|".join(map(re.escape, needles)))
+    found = {m.group() for m in pattern.finditer(text)}
+    missing = set(needles) - found
+    assert not missing, f"missing: {missing}"
+
+
+@pytest.fixture
 def clear_resumes():
-    """Clear the resumes dict before and after each test."""
+    """
+    Clear the resumes dict before and after each test.
+    
+    Only requested by the classes that populate _resumes.
+    """
     _resumes.clear()
     yield
     _resumes.clear()
@@ -113,50 +173,47 @@ def clear_resumes():
 # Tests for _validate_date
 # ============================================================================
 
-class TestValidateDate:
-    """Tests for the _validate_date helper function."""
-
-    def test_valid_yyyy_mm(self):
-        """Test YYYY-MM format."""
-        assert _validate_date("2024-01") == "2024-01"
-        assert _validate_date("2020-12") == "2020-12"
-
-    def test_valid_yyyy_mm_dd(self):
-        """Test YYYY-MM-DD format (should extract YYYY-MM)."""
-        assert _validate_date("2024-01-15") == "2024-01"
-        assert _validate_date("2020-12-31") == "2020-12"
-
-    def test_valid_yyyy_slash_mm(self):
-        """Test YYYY/MM format."""
-        assert _validate_date("2024/01") == "2024-01"
-        assert _validate_date("2020/12") == "2020-12"
+_VALIDATE_DATE_CASES = [
+    # YYYY-MM
+    ("2024-01", "2024-01"),
+    ("2020-12", "2020-12"),
+    # YYYY-MM-DD (day is dropped)
+    ("2024-01-15", "2024-01"),
+    ("2020-12-31", "2020-12"),
+    # YYYY/MM
+    ("2024/01", "2024-01"),
+    ("2020/12", "2020-12"),
+    # MM/YYYY (converted to YYYY-MM)
+    ("01/2024", "2024-01"),
+    ("12/2020", "2020-12"),
+    # YYYY (-01 appended)
+    ("2024", "2024-01"),
+    ("2020", "2020-01"),
+    # Invalid and empty
+    ("invalid", ""),
+    ("", ""),
+    ("abc-def", ""),
+    ("2024-1a", ""),
+    ("12/20x4", ""),
+    ("2024-01-3x", ""),
+    ("   ", ""),
+]
 
-    def test_valid_mm_yyyy(self):
-        """Test MM/YYYY format (should convert to YYYY-MM)."""
-        assert _validate_date("01/2024") == "2024-01"
-        assert _validate_date("12/2020") == "2020-12"
 
-    def test_valid_yyyy_only(self):
-        """Test YYYY format (should append -01)."""
-        assert _validate_date("2024") == "2024-01"
-        assert _validate_date("2020") == "2020-01"
-
-    def test_invalid_date(self):
-        """Test invalid date formats return empty string."""
-        assert _validate_date("invalid") == ""
-        assert _validate_date("") == ""
-        assert _validate_date("abc-def") == ""
+class TestValidateDate:
+    """Tests for the _validate_date helper function."""
 
-    def test_empty_and_none(self):
-        """Test empty string and edge cases."""
-        assert _validate_date("") == ""
-        assert _validate_date("   ") == ""
+    @pytest.mark.parametrize("raw,expected", _VALIDATE_DATE_CASES)
+    def test_validate_date(self, raw, expected):
+        """Test each supported format normalizes to YYYY-MM, invalid input to ''."""
+        assert _validate_date(raw) == expected
 
 
 # ============================================================================
 # Tests for create_resume
 # ============================================================================
 
+@pytest.mark.usefixtures("clear_resumes")
 class TestCreateResume:
     """Tests for the create_resume function."""
 
@@ -200,13 +257,13 @@ class TestCreateResume:
         assert result["status"] == "error"
         assert "surnames" in result["message"].lower()
 
-    def test_create_multiple_resumes(self, sample_mac_json):
+    def test_create_multiple_resumes(self, sample_mac_json, mutable_mac_json):
         """Test creating multiple resumes."""
         result1 = create_resume(mac_json=sample_mac_json)
         
         # Modify for second resume
-        sample_mac_json["aboutMe"]["profile"]["name"] = "Jane"
-        result2 = create_resume(mac_json=sample_mac_json)
+        mutable_mac_json["aboutMe"]["profile"]["name"] = "Jane"
+        result2 = create_resume(mac_json=mutable_mac_json)
         
         assert result1["resume_id"] != result2["resume_id"]
         assert len(_resumes) == 2
@@ -216,6 +273,7 @@ class TestCreateResume:
 # Tests for list_resumes
 # ============================================================================
 
+@pytest.mark.usefixtures("clear_resumes")
 class TestListResumes:
     """Tests for the list_resumes function."""
 
@@ -242,6 +300,7 @@ class TestListResumes:
 # Tests for delete_resume
 # ============================================================================
 
+@pytest.mark.usefixtures("clear_resumes")
 class TestDeleteResume:
     """Tests for the delete_resume function."""
 
@@ -281,6 +340,16 @@ class TestGetMacSchema:
         assert "sections" in result
         assert "example_minimal" in result
 
+    def test_get_schema_mutation_does_not_leak(self):
+        """Test that mutating a returned schema does not affect later calls."""
+        first = get_mac_schema()
+        expected = copy.deepcopy(first)
+        first["sections"]["injected"] = "value"
+        first["version"] = "changed"
+        first.clear()
+        
+        assert get_mac_schema() == expected
+
 
 # ============================================================================
 # Tests for _mac_to_europass_xml
@@ -289,23 +358,21 @@ class TestGetMacSchema:
 class TestMacToEuropassXml:
     """Tests for the MAC to Europass XML conversion."""
 
-    def test_xml_generation(self, sample_mac_json):
+    def test_xml_generation(self, sample_xml):
         """Test that XML is generated with correct structure."""
-        xml = _mac_to_europass_xml(sample_mac_json)
-        
-        # Check XML declaration
-        assert '<?xml version="1.0" encoding="utf-8"?>' in xml
-        
-        # Check root element
-        assert "<Candidate" in xml
-        assert "</Candidate>" in xml
-        
-        # Check personal info (uses oa:GivenName and hr:FamilyName)
-        assert "<oa:GivenName>John</oa:GivenName>" in xml
-        assert "<hr:FamilyName>Doe</hr:FamilyName>" in xml
-        
-        # Check contact info
-        assert "john@example.com" in xml
+        xml = sample_xml
+        
+        # XML declaration, root element, personal info (oa:GivenName and
+        # hr:FamilyName) and contact info
+        _assert_contains_all(
+            xml,
+            '<?xml version="1.0" encoding="utf-8"?>',
+            "<Candidate",
+            "</Candidate>",
+            "<oa:GivenName>John</oa:GivenName>",
+            "<hr:FamilyName>Doe</hr:FamilyName>",
+            "john@example.com",
+        )
 
     def test_xml_escapes_special_chars(self):
         """Test that special characters are properly escaped."""
@@ -323,108 +390,87 @@ class TestMacToEuropassXml:
         
         # Check XML escaping (& and < > are escaped, apostrophe is optional)
         # Note: PersonTitle/PersonDescription are NOT generated (not supported by Europass)
-        assert "John &amp; Jane" in xml
-        assert "O'Brien &lt;Junior&gt;" in xml  # apostrophe is valid in XML
+        # apostrophe is valid in XML
+        _assert_contains_all(xml, "John &amp; Jane", "O'Brien &lt;Junior&gt;")
+
+    def test_xml_escapes_double_quotes(self):
+        """Test that double quotes are escaped so values stay attribute-safe."""
+        mac = {**_BASE_PROFILE_MAC, "aboutMe": {"profile": {"name": 'Jane "JJ"', "surnames": "Smith"}}}
+        
+        xml = _mac_to_europass_xml(mac)
+        
+        assert "<oa:GivenName>Jane &quot;JJ&quot;</oa:GivenName>" in xml
 
-    def test_xml_with_employment(self, sample_mac_json):
+    def test_xml_is_well_formed(self, sample_xml):
+        """Test that the string-built XML parses as a namespaced Candidate."""
+        root = ET.fromstring(sample_xml.encode("utf-8"))
+        
+        assert root.tag == "{http://www.europass.eu/1.0}Candidate"
+
+    def test_xml_escaped_values_round_trip(self):
+        """Test that escaped special characters parse back to the original text."""
+        name = 'John & "Jane" <Jr>'
+        mac = {**_BASE_PROFILE_MAC, "aboutMe": {"profile": {"name": name, "surnames": "O'Brien"}}}
+        
+        root = ET.fromstring(_mac_to_europass_xml(mac).encode("utf-8"))
+        
+        given = root.find(".//{http://www.openapplications.org/oagis/9}GivenName")
+        assert given.text == name
+
+    def test_xml_with_employment(self, sample_xml):
         """Test XML generation with employment history."""
-        xml = _mac_to_europass_xml(sample_mac_json)
+        xml = sample_xml
         
-        assert "EmploymentHistory" in xml
-        assert "Tech Corp" in xml
-        assert "Senior Developer" in xml
-        assert "2020-01" in xml
+        _assert_contains_all(xml, "EmploymentHistory", "Tech Corp", "Senior Developer", "2020-01")
 
-    def test_xml_with_education(self, sample_mac_json):
+    def test_xml_with_education(self, sample_xml):
         """Test XML generation with education history."""
-        xml = _mac_to_europass_xml(sample_mac_json)
+        xml = sample_xml
         
-        assert "EducationHistory" in xml
-        assert "Computer Science" in xml
-        assert "University of Paris" in xml
+        _assert_contains_all(xml, "EducationHistory", "Computer Science", "University of Paris")
 
-    def test_xml_with_languages(self, sample_mac_json):
+    def test_xml_with_languages(self, sample_xml):
         """Test XML generation with language skills."""
-        xml = _mac_to_europass_xml(sample_mac_json)
+        xml = sample_xml
         
-        # Languages are in PersonCompetency with TaxonomyID=language
-        assert "PersonCompetency" in xml
-        assert "language" in xml  # TaxonomyID
-        assert "CEF-" in xml  # CEF language level dimensions
+        # Languages are in PersonCompetency with TaxonomyID=language and
+        # CEF language level dimensions
+        _assert_contains_all(xml, "PersonCompetency", "language", "CEF-")
 
-    def test_xml_with_skills(self, sample_mac_json):
+    def test_xml_with_skills(self, sample_xml):
         """Test XML generation with hard and soft skills."""
-        xml = _mac_to_europass_xml(sample_mac_json)
+        xml = sample_xml
         
-        assert "PersonQualifications" in xml
-        assert "Python" in xml
-        assert "Leadership" in xml
+        _assert_contains_all(xml, "PersonQualifications", "Python", "Leadership")
 
     def test_xml_with_full_description(self):
         """Test that fullDescription is used over challenges."""
-        mac = {
-            "settings": {"language": "EN"},
-            "aboutMe": {
-                "profile": {"name": "Jane", "surnames": "Smith"}
-            },
-            "experience": {
-                "jobs": [{
-                    "organization": {"name": "Acme Inc"},
-                    "roles": [{
-                        "name": "Engineer",
-                        "startDate": "2022-01",
-                        "challenges": [{"description": "Short bullet"}],
-                        "fullDescription": "<p><strong>Contexte :</strong> Rich HTML content with full details.</p>"
-                    }]
-                }]
-            }
-        }
+        mac = copy.deepcopy(_BASE_DESC_MAC)
+        mac["experience"]["jobs"][0]["roles"][0]["fullDescription"] = (
+            "<p><strong>Contexte :</strong> Rich HTML content with full details.</p>"
+        )
         
         xml = _mac_to_europass_xml(mac)
         
         # fullDescription should be used instead of challenges
-        assert "Contexte :" in xml
-        assert "Rich HTML content" in xml
+        _assert_contains_all(xml, "Contexte :", "Rich HTML content")
         # challenges short text should NOT appear since fullDescription takes precedence
         assert "Short bullet" not in xml
 
     def test_xml_with_full_description_fallback_to_challenges(self):
         """Test that challenges are used when fullDescription is missing."""
-        mac = {
-            "settings": {"language": "EN"},
-            "aboutMe": {
-                "profile": {"name": "Jane", "surnames": "Smith"}
-            },
-            "experience": {
-                "jobs": [{
-                    "organization": {"name": "Acme Inc"},
-                    "roles": [{
-                        "name": "Engineer",
-                        "startDate": "2022-01",
-                        "challenges": [{"description": "Fallback bullet point"}]
-                        # No fullDescription field
-                    }]
-                }]
-            }
-        }
-        
-        xml = _mac_to_europass_xml(mac)
+        # Base role has no fullDescription field
+        xml = _mac_to_europass_xml(_BASE_DESC_MAC)
         
         # challenges should be used as fallback
-        assert "Fallback bullet point" in xml
+        assert "Short bullet point" in xml
 
     def test_xml_with_profile_picture(self):
         """Test that profilePicture generates Attachment XML."""
         # Use a small base64 string for testing (1x1 red pixel PNG)
         test_base64 = "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8z8DwHwAFBQIAX8jx0gAAAABJRU5ErkJggg=="
         
-        mac = {
-            "settings": {"language": "EN"},
-            "aboutMe": {
-                "profile": {"name": "Jane", "surnames": "Smith"}
-            },
-            "profilePicture": test_base64
-        }
+        mac = {**_BASE_PROFILE_MAC, "profilePicture": test_base64}
         
         xml = _mac_to_europass_xml(mac)
         
@@ -437,15 +483,8 @@ class TestMacToEuropassXml:
 
     def test_xml_without_profile_picture(self):
         """Test that no Attachment is generated when profilePicture is missing."""
-        mac = {
-            "settings": {"language": "EN"},
-            "aboutMe": {
-                "profile": {"name": "Jane", "surnames": "Smith"}
-            }
-            # No profilePicture field
-        }
-        
-        xml = _mac_to_europass_xml(mac)
+        # Base MAC has no profilePicture field
+        xml = _mac_to_europass_xml(_BASE_PROFILE_MAC)
         
         # Should NOT have Attachment section
         assert "<eures:Attachment>" not in xml
@@ -459,17 +498,20 @@ class TestMacToEuropassXml:
 class TestParseDocument:
     """Tests for the parse_document function."""
 
-    def test_file_not_found(self):
+    def test_file_not_found(self, monkeypatch):
         """Test error when file doesn't exist."""
+        monkeypatch.setattr("src.mcp_server.Path.exists", lambda self: False)
         result = parse_document("/nonexistent/path/file.pdf")
         
         assert isinstance(result, dict)
         assert result["status"] == "error"
         assert "not found" in result["message"].lower()
 
-    def test_path_is_directory(self, tmp_path):
+    def test_path_is_directory(self, monkeypatch):
         """Test error when path is a directory."""
-        result = parse_document(str(tmp_path))
+        monkeypatch.setattr("src.mcp_server.Path.exists", lambda self: True)
+        monkeypatch.setattr("src.mcp_server.Path.is_file", lambda self: False)
+        result = parse_document("/some/directory")
         
         assert isinstance(result, dict)
         assert result["status"] == "error"
@@ -491,6 +533,7 @@ class TestParseDocument:
 # Integration Tests
 # ============================================================================
 
+@pytest.mark.usefixtures("clear_resumes")
 class TestIntegration:
     """Integration tests for the full workflow."""
 
@@ -501,10 +544,9 @@ class TestIntegration:
         assert create_result["status"] == "success"
         resume_id = create_result["resume_id"]
         
-        # List
-        list_result = list_resumes()
-        assert list_result["count"] == 1
-        assert list_result["resumes"][0]["resume_id"] == resume_id
+        # Stored (list_resumes itself is covered by TestListResumes)
+        assert len(_resumes) == 1
+        assert next(iter(_resumes)) == resume_id
         
         # Delete
         delete_result = delete_resume(resume_id=resume_id)
@@ -518,14 +560,31 @@ class TestIntegration:
         """Test that old resumes are cleaned up when max is reached."""
         from src.mcp_server import _MAX_RESUMES
         
+        about_me = sample_mac_json["aboutMe"]
+        payloads = [
+            {
+                **sample_mac_json,
+                "aboutMe": {**about_me, "profile": {**about_me["profile"], "name": f"User{i}"}},
+            }
+            for i in range(_MAX_RESUMES + 5)
+        ]
+        
         # Create more than max resumes
-        for i in range(_MAX_RESUMES + 5):
-            sample_mac_json["aboutMe"]["profile"]["name"] = f"User{i}"
-            create_resume(mac_json=sample_mac_json)
+        for payload in payloads:
+            create_resume(mac_json=payload)
         
         # Should be at max capacity
         assert len(_resumes) == _MAX_RESUMES
 
+    def test_lru_evicts_oldest_first(self, sample_mac_json):
+        """Test that eviction drops the oldest resume and keeps the newest."""
+        from src.mcp_server import _MAX_RESUMES
+        
+        ids = [create_resume(mac_json=sample_mac_json)["resume_id"] for _ in range(_MAX_RESUMES + 1)]
+        
+        assert ids[0] not in _resumes
+        assert list(_resumes) == ids[1:]
+
 
 # ============================================================================
 # Country Code Conversion Tests
@@ -548,6 +607,16 @@ class TestCountryToCode:
         assert _country_to_code("fr") == "fr"
         assert _country_to_code("US") == "us"
     
+    def test_codes_are_interned(self):
+        """Test passthrough codes share one object with the literal code."""
+        import sys
+        assert _country_to_code("FR") is sys.intern("fr")
+        assert _country_to_code(" fr ") is sys.intern("fr")
+    
+    def test_two_letter_alias_not_passed_through(self):
+        """Test 2-letter aliases that are not ISO codes use the name mapping."""
+        assert _country_to_code("UK") == "gb"
+    
     def test_empty_country(self):
         """Test empty input returns empty string."""
         assert _country_to_code("") == ""
@@ -592,6 +661,10 @@ class TestLanguageToIso639b:
         assert _language_to_iso639b("German") == "ger"
         assert _language_to_iso639b("deutsch") == "ger"
     
+    def test_decomposed_unicode_alias(self):
+        """Test NFD-encoded aliases match their composed form."""
+        assert _language_to_iso639b("Franc\u0327ais") == "fre"
+    
     def test_unknown_language(self):
         """Test unknown language returns first 3 chars."""
         assert _language_to_iso639b("Klingon") == "kli"
@@ -16,27 +16,25 @@ from markdown_transform import transform_headings_to_bullets
 
 
 # Custom strategies for markdown content
-@st.composite
-def markdown_list_item(draw, max_depth=3, current_depth=0):
-    """Generate a markdown list item with optional nesting."""
-    text = draw(st.text(
-        alphabet=st.characters(whitelist_categories=('L', 'N', 'P', 'S')),
-        min_size=5,
-        max_size=50
-    ).filter(lambda x: x.strip()))
-    
-    indent = "    " * current_depth
-    item = f"{indent}- {text}"
-    
-    # Maybe add nested items
-    if current_depth < max_depth and draw(st.booleans()):
-        num_nested = draw(st.integers(min_value=1, max_value=3))
-        nested = []
-        for _ in range(num_nested):
-            nested.append(draw(markdown_list_item(max_depth, current_depth + 1)))
-        return item + "\n" + "\n".join(nested)
-    
-    return item
+_list_item_text = st.text(
+    alphabet=st.characters(whitelist_categories=('L', 'N', 'P', 'S')),
+    min_size=5,
+    max_size=50
+).filter(lambda x: x.strip())
+
+
+def _nest_items(parent, children):
+    """Attach child items under parent, indenting every child line one level."""
+    nested = "\n".join("    " + line for child in children for line in child.split("\n"))
+    return f"{parent}\n{nested}"
+
+
+# A markdown list item with optional nesting (1-3 children per level)
+markdown_list_item = st.recursive(
+    _list_item_text.map(lambda text: f"- {text}"),
+    lambda children: st.builds(_nest_items, children, st.lists(children, min_size=1, max_size=3)),
+    max_leaves=8,
+)
 
 
 @st.composite
@@ -49,7 +47,7 @@ def markdown_section(draw):
     ).filter(lambda x: x.strip() and '\n' not in x))
     
     num_items = draw(st.integers(min_value=1, max_value=5))
-    items = [draw(markdown_list_item(max_depth=2)) for _ in range(num_items)]
+    items = [draw(markdown_list_item) for _ in range(num_items)]
     
     return f"## {heading_text}\n" + "\n".join(items)
 
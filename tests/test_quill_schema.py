@@ -12,11 +12,13 @@ Tests the quill_schema.py module which provides:
 from pathlib import Path
 
 import pytest
+from pydantic import ValidationError
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from quill_schema import (
+    QUILL_DELTA_ADAPTER,
     QuillDelta,
     DeltaInsertOp,
     DeltaRetainOp,
@@ -81,6 +83,38 @@ class TestQuillDeltaBasic:
             ]
         })
         assert delta.to_plain_text() == "Hello World\n"
+    
+    def test_plain_text_cached_on_frozen_delta(self):
+        """plain_text is computed once and the delta cannot be reassigned."""
+        delta = QuillDelta.model_validate({
+            "ops": [{"retain": 2}, {"insert": {"image": "https://example.com/a.png"}}, {"insert": "Text\n"}]
+        })
+        assert delta.plain_text == "Text\n"
+        assert delta.to_plain_text() is delta.plain_text
+        with pytest.raises(Exception):
+            delta.ops = [{"insert": "Other\n"}]
+    
+    def test_plain_text_after_model_copy_update(self):
+        """model_copy(update=...) recomputes plain_text for the new ops."""
+        delta = QuillDelta.model_validate({"ops": [{"insert": "hi\n"}]})
+        assert delta.plain_text == "hi\n"
+        
+        copied = delta.model_copy(update={"ops": [DeltaInsertOp(insert="bye\n")]})
+        assert copied.plain_text == "bye\n"
+        assert copied.to_plain_text() == "bye\n"
+        assert delta.plain_text == "hi\n"
+    
+    def test_ops_stay_a_list(self):
+        """Strict validation accepts JSON lists and dumps round-trip as lists."""
+        data = {"ops": [{"insert": "a\n"}]}
+        delta = QuillDelta.model_validate(data, strict=True)
+        assert delta.model_dump(exclude_none=True) == data
+    
+    def test_op_error_reported_once(self):
+        """An invalid op reports only its own error, not the list length."""
+        with pytest.raises(ValidationError) as exc_info:
+            QuillDelta.model_validate({"ops": [{"insert": "a\n", "attributes": {"header": 9}}]})
+        assert [err["type"] for err in exc_info.value.errors()] == ["less_than_equal"]
 
 
 # =============================================================================
@@ -169,7 +203,7 @@ class TestBlockAttributes:
     def test_header_levels(self):
         """Header levels 1-6 should validate."""
         for level in range(1, 7):
-            delta = QuillDelta.model_validate({
+            delta = QUILL_DELTA_ADAPTER.validate_python({
                 "ops": [
                     {"insert": f"Heading {level}"},
                     {"insert": "\n", "attributes": {"header": level}}
@@ -212,7 +246,7 @@ class TestBlockAttributes:
     def test_indent_levels(self):
         """Indent levels 0-8 should validate."""
         for indent in range(0, 9):
-            delta = QuillDelta.model_validate({
+            delta = QUILL_DELTA_ADAPTER.validate_python({
                 "ops": [
                     {"insert": "Indented"},
                     {"insert": "\n", "attributes": {"indent": indent}}
@@ -220,6 +254,53 @@ class TestBlockAttributes:
             })
             assert delta.ops[1].attributes.indent == indent
     
+    def test_identical_attributes_share_instance(self):
+        """Equal attribute dicts resolve to one frozen, shared instance."""
+        delta = QuillDelta.model_validate({
+            "ops": [
+                {"insert": "A"},
+                {"insert": "\n", "attributes": {"list": "bullet", "indent": 1}},
+                {"insert": "B"},
+                {"insert": "\n", "attributes": {"list": "bullet", "indent": 1}},
+            ]
+        })
+        assert delta.ops[1].attributes is delta.ops[3].attributes
+        with pytest.raises(Exception):
+            delta.ops[1].attributes.indent = 2
+    
+    def test_unhashable_extra_attribute(self):
+        """Custom attributes with unhashable values still validate."""
+        delta = QuillDelta.model_validate({
+            "ops": [{"insert": "x\n", "attributes": {"bold": True, "tags": ["a", "b"]}}]
+        })
+        assert delta.ops[0].attributes.bold is True
+        assert delta.ops[0].attributes.tags == ["a", "b"]
+    
+    def test_cached_attributes_keep_value_types(self):
+        """True, 1 and 1.0 hash equal but must not share a cached instance."""
+        for value in (1, True, 1.0, "1"):
+            delta = QuillDelta.model_validate({
+                "ops": [{"insert": "x\n", "attributes": {"custom": value}}]
+            })
+            assert type(delta.ops[0].attributes.custom) is type(value)
+            assert delta.ops[0].attributes.custom == value
+    
+    def test_strict_validation_not_weakened_by_cache(self):
+        """Strict callers still reject coercible values, lax callers coerce them."""
+        for attributes in ({"bold": 1}, {"indent": "2"}):
+            data = {"insert": "x\n", "attributes": attributes}
+            with pytest.raises(ValidationError):
+                DeltaInsertOp.model_validate(data, strict=True)
+            with pytest.raises(ValidationError):
+                QuillDelta.model_validate({"ops": [data]}, strict=True)
+    
+        assert DeltaInsertOp.model_validate({"insert": "x", "attributes": {"bold": 1}}).attributes.bold is True
+        assert DeltaInsertOp.model_validate({"insert": "x", "attributes": {"indent": "2"}}).attributes.indent == 2
+        # A shape that passes strictly is still shared in strict mode
+        strict_op = DeltaInsertOp.model_validate({"insert": "x", "attributes": {"bold": True}}, strict=True)
+        lax_op = DeltaInsertOp.model_validate({"insert": "y", "attributes": {"bold": True}})
+        assert strict_op.attributes is lax_op.attributes
+    
     def test_indent_too_deep(self):
         """Indent level > 8 should fail."""
         with pytest.raises(Exception):
@@ -279,6 +360,12 @@ class TestEmbedTypes:
         })
         assert "youtube" in delta.ops[0].insert["video"]
 
+    @pytest.mark.parametrize("insert", [{}, 5, None, b"bytes"])
+    def test_invalid_insert_fails(self, insert):
+        """Empty embeds and non-string scalars should fail validation."""
+        with pytest.raises(Exception):
+            QuillDelta.model_validate({"ops": [{"insert": insert}]})
+
 
 # =============================================================================
 # Change Delta Tests (retain/delete)
@@ -328,6 +415,24 @@ class TestChangeDelta:
             ]
         })
         assert len(delta.ops) == 4
+        assert [type(op) for op in delta.ops] == [
+            DeltaRetainOp, DeltaDeleteOp, DeltaInsertOp, DeltaRetainOp
+        ]
+    
+    def test_ops_are_immutable(self):
+        """Validated ops and Europass items are frozen."""
+        delta = QuillDelta.model_validate({"ops": [{"retain": 5}, {"insert": "x"}]})
+        with pytest.raises(Exception):
+            delta.ops[0].retain = 1
+        with pytest.raises(Exception):
+            delta.ops[1].insert = "y"
+        with pytest.raises(Exception):
+            EuropassListItem(content="Item").indent_level = 2
+    
+    def test_op_without_known_key_fails(self):
+        """Ops with none of insert/retain/delete should fail validation."""
+        with pytest.raises(Exception):
+            QuillDelta.model_validate({"ops": [{"attributes": {"bold": True}}]})
 
 
 # =============================================================================
@@ -352,6 +457,11 @@ class TestValidationHelpers:
         result = validate_delta_strict({"ops": [{"insert": "Test\n"}]})
         assert isinstance(result, QuillDelta)
     
+    def test_validate_delta_invalid_type(self):
+        """Non-mapping input is reported as invalid, not raised."""
+        assert validate_delta(None) is False
+        assert validate_delta("not a delta") is False
+    
     def test_validate_delta_strict_invalid(self):
         """Invalid delta should raise exception."""
         with pytest.raises(Exception):
@@ -367,6 +477,17 @@ class TestValidationHelpers:
         """create_simple_delta with attributes should work."""
         delta = create_simple_delta("Bold text", {"bold": True})
         assert delta.ops[0].attributes.bold is True
+    
+    def test_create_simple_delta_keeps_attribute_types(self):
+        """Cached attribute shapes do not conflate True with 1."""
+        assert create_simple_delta("x", {"custom": 1}).ops[0].attributes.custom == 1
+        custom = create_simple_delta("x", {"custom": True}).ops[0].attributes.custom
+        assert custom is True
+    
+    def test_create_simple_delta_invalid_attributes(self):
+        """Caller-supplied attributes are still validated."""
+        with pytest.raises(Exception):
+            create_simple_delta("Heading", {"header": 0})
 
 
 # =============================================================================
@@ -399,6 +520,14 @@ class TestEuropassPatterns:
         
         assert ops[0]["attributes"]["bold"] is True
     
+    def test_europass_list_item_ops_are_independent(self):
+        """Mutating returned ops does not leak into later items."""
+        ops = EuropassListItem(content="First").to_delta_ops()
+        ops[1]["attributes"]["indent"] = 3
+        
+        again = EuropassListItem(content="Second").to_delta_ops()
+        assert again[1] == {"insert": "\n", "attributes": {"list": "bullet"}}
+    
     def test_europass_section_with_header(self):
         """EuropassSection with header should be valid."""
         section = EuropassSection(
@@ -427,6 +556,10 @@ class TestEuropassPatterns:
         
         # Should have 6 ops: 3 content + 3 newlines
         assert len(delta.ops) == 6
+        assert all(isinstance(op, DeltaInsertOp) for op in delta.ops)
+        assert delta.ops[1].attributes.indent is None
+        assert delta.ops[3].attributes.indent == 1
+        assert delta == QuillDelta.model_validate(delta.model_dump(exclude_none=True))
 
 
 # =============================================================================
@@ -492,6 +625,55 @@ class TestHtmlToDelta:
         
         header_ops = [op for op in ops if op.get("attributes", {}).get("header") == 2]
         assert len(header_ops) >= 1
+    
+    def test_entities_and_nested_formatting(self):
+        """Entities decode and nested inline tags end where their element ends."""
+        ops = html_to_delta_ops("<p>R&amp;D <strong>bold <em>both</em></strong> end</p>")
+        
+        assert ops == [
+            {"insert": "R&D "},
+            {"insert": "bold ", "attributes": {"bold": True}},
+            {"insert": "both", "attributes": {"bold": True, "italic": True}},
+            {"insert": " end"},
+            {"insert": "\n"},
+        ]
+    
+    def test_empty_html(self):
+        """Empty input still yields a single newline op."""
+        assert html_to_delta_ops("") == [{"insert": "\n"}]
+    
+    def test_unterminated_tags_do_not_end_lines(self):
+        """Only explicit end tags emit newlines; there is no HTML5 tree building."""
+        assert html_to_delta_ops("<p>a<p>b") == [{"insert": "ab"}]
+        assert html_to_delta_ops("<ul><li>a<li>b</ul>") == [{"insert": "ab"}]
+    
+    def test_head_text_kept(self):
+        """Text inside <head> is treated like any other text."""
+        ops = html_to_delta_ops("<head><title>T</title></head><p>x</p>")
+        assert ops == [{"insert": "Tx"}, {"insert": "\n"}]
+    
+    def test_valueless_href(self):
+        """A bare <a href> keeps a None link, as with html.parser."""
+        ops = html_to_delta_ops("<p><a href>x</a></p>")
+        assert ops[0] == {"insert": "x", "attributes": {"link": None}}
+    
+    def test_repeated_input_hits_cache(self):
+        """Same HTML is only parsed once."""
+        html_to_delta_ops.cache_clear()
+        html = "<p><strong>Cached</strong></p>"
+        assert html_to_delta_ops(html) == html_to_delta_ops(html)
+        assert html_to_delta_ops.cache_info().hits == 1
+    
+    def test_mutating_result_does_not_affect_cache(self):
+        """Callers get independent copies of the cached ops."""
+        html = "<p><strong>Bold</strong></p>"
+        first = html_to_delta_ops(html)
+        first[0]["attributes"]["bold"] = False
+        first.append({"insert": "extra"})
+        assert html_to_delta_ops(html) == [
+            {"insert": "Bold", "attributes": {"bold": True}},
+            {"insert": "\n"},
+        ]
 
 
 # =============================================================================
@@ -525,6 +707,28 @@ class TestCountFormattedText:
         counts = delta.count_formatted_text()
         assert counts["bold"] == 4
         assert counts["italic"] == 6
+    
+    def test_count_plain_text_only(self):
+        """Deltas without attributes count zero for every format."""
+        delta = QuillDelta.model_validate({
+            "ops": [{"insert": "Plain "}, {"insert": "text"}, {"insert": "\n"}]
+        })
+        assert set(delta.count_formatted_text().values()) == {0}
+    
+    def test_count_ignores_retain_and_embeds(self):
+        """Only text inserts contribute; retain attributes and embeds do not."""
+        delta = QuillDelta.model_validate({
+            "ops": [
+                {"retain": 5, "attributes": {"bold": True}},
+                {"insert": {"image": "https://example.com/a.png"}, "attributes": {"bold": True}},
+                {"insert": "Link", "attributes": {"link": "https://example.com", "underline": True}},
+                {"insert": "\n", "attributes": {"list": "bullet"}},
+                {"delete": 2},
+            ]
+        })
+        assert delta.count_formatted_text() == {
+            "bold": 0, "italic": 0, "underline": 4, "link": 4, "header": 0, "list": 1,
+        }
 
 
 # =============================================================================
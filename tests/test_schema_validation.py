@@ -7,19 +7,22 @@ Ensures generated output conforms to expected schemas.
 
 import pytest
 import json
+import re
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from mac_schema import extracted_cv_to_mac, ExtractedCV, ExtractedJob
+
+_ISO_DATE_RE = re.compile(r'^\d{4}-\d{2}(-\d{2})?$')
+
 
 class TestMACSchema:
     """Validate MAC JSON structure."""
 
     def test_mac_schema_required_fields(self):
         """MAC JSON must have required top-level fields."""
-        from mac_schema import extracted_cv_to_mac, ExtractedCV, ExtractedJob
-        
         # Minimal valid CV with correct field names
         cv = ExtractedCV(
             first_name="Test",
@@ -46,8 +49,6 @@ class TestMACSchema:
         
     def test_mac_job_structure(self):
         """Job entries must have correct structure."""
-        from mac_schema import extracted_cv_to_mac, ExtractedCV, ExtractedJob
-        
         cv = ExtractedCV(
             first_name="Test",
             last_name="User",
@@ -72,6 +73,10 @@ class TestMACSchema:
         # Organization
         assert "organization" in job
         assert job["organization"]["name"] == "Acme Inc"
+        assert job["organization"]["location"] == {
+            "municipality": "Paris",
+            "country": "France",
+        }
         
         # Roles
         assert "roles" in job
@@ -84,8 +89,6 @@ class TestMACSchema:
 
     def test_mac_dates_iso_format(self):
         """Dates must be in ISO format."""
-        from mac_schema import extracted_cv_to_mac, ExtractedCV, ExtractedJob
-        
         cv = ExtractedCV(
             first_name="Test",
             last_name="User",
@@ -104,16 +107,12 @@ class TestMACSchema:
         role = mac["experience"]["jobs"][0]["roles"][0]
         
         # Dates should be valid ISO format
-        import re
-        date_pattern = r'^\d{4}-\d{2}(-\d{2})?$'
-        assert re.match(date_pattern, role["startDate"])
+        assert _ISO_DATE_RE.match(role["startDate"])
         if role.get("finishDate"):
-            assert re.match(date_pattern, role["finishDate"])
+            assert _ISO_DATE_RE.match(role["finishDate"])
 
     def test_description_transform_applied(self):
         """Descriptions should have AST transform applied."""
-        from mac_schema import extracted_cv_to_mac, ExtractedCV, ExtractedJob
-        
         # Input with H2 heading format
         cv = ExtractedCV(
             first_name="Test",
@@ -144,8 +143,6 @@ class TestDescriptionPreservation:
 
     def test_bold_preserved(self):
         """Bold formatting should be preserved."""
-        from mac_schema import extracted_cv_to_mac, ExtractedCV, ExtractedJob
-        
         cv = ExtractedCV(
             first_name="Test",
             last_name="User",
@@ -165,8 +162,6 @@ class TestDescriptionPreservation:
 
     def test_links_preserved(self):
         """Link formatting should be preserved."""
-        from mac_schema import extracted_cv_to_mac, ExtractedCV, ExtractedJob
-        
         cv = ExtractedCV(
             first_name="Test",
             last_name="User",
@@ -186,8 +181,6 @@ class TestDescriptionPreservation:
 
     def test_unicode_preserved(self):
         """Unicode should be preserved."""
-        from mac_schema import extracted_cv_to_mac, ExtractedCV, ExtractedJob
-        
         cv = ExtractedCV(
             first_name="Gaëtan",
             last_name="Fortaine",